@@ -9,6 +9,7 @@ __version__ = "0.1.7"
 # Identity and Resource Management
 from .wrapper import (
     ResourceNotFoundError,
+    set_log_level,
     Identity,
     Subscription,
     ResourceGroup,
@@ -31,12 +32,16 @@ from .wrapper import (
     # AI Services
     AIService,
     OpenAIClient,
-    
+    AsyncOpenAIClient,
+    EmbeddingCache,
+    SemanticEmbeddingCache,
+
     # Document Intelligence
     DocumentIntelligenceService,
     DocumentIntelligenceClientWrapper,
     DocumentIntelligenceModels,
     DocumentAnalysisClientWrapper,
+    AsyncDocumentAnalysisClientWrapper,
     FormRecognizerModels
 )
 
@@ -46,6 +51,7 @@ from .main import main as cli_main
 # Convenient access to common classes and functions
 __all__ = [
     "ResourceNotFoundError",
+    "set_log_level",
     # Identity and Resource Management
     "Identity",
     "Subscription", 
@@ -69,12 +75,16 @@ __all__ = [
     # AI Services
     "AIService",
     "OpenAIClient",
-    
+    "AsyncOpenAIClient",
+    "EmbeddingCache",
+    "SemanticEmbeddingCache",
+
     # Document Intelligence
     "DocumentIntelligenceService",
     "DocumentIntelligenceClientWrapper",
     "DocumentIntelligenceModels",
     "DocumentAnalysisClientWrapper",
+    "AsyncDocumentAnalysisClientWrapper",
     "FormRecognizerModels",
     
     # CLI
@@ -1,23 +1,38 @@
 import os
+import hashlib
+import logging
 import regex as re
 import json
 from dotenv import load_dotenv
 load_dotenv()
 
-from azure.core.exceptions import ResourceNotFoundError as AzureResourceNotFoundError
+try:
+    # orjson serializes and parses large payloads several times faster than
+    # the stdlib json module; helpers below fall back to json without it
+    import orjson
+except ImportError:
+    orjson = None
+
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError as AzureResourceNotFoundError
 
 class ResourceNotFoundError(AzureResourceNotFoundError):
     def __init__(self, message: str):
         super().__init__(message)
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from enum import Enum
-from time import time 
-from typing import Any, Callable, List, Dict, Optional, Tuple, Union, ClassVar
+from time import time, monotonic, sleep
+import mmap
+import queue
+import threading
+from typing import Any, Callable, List, Dict, Optional, Set, Tuple, Union, ClassVar
 from datetime import datetime, timezone # Add datetime imports
 
 from azure.identity import ClientSecretCredential, DefaultAzureCredential
 from azure.core.credentials import AccessToken, TokenCredential
+from azure.core.polling import LROPoller
 from azure.mgmt.resource import SubscriptionClient, ResourceManagementClient
 from azure.mgmt.storage import StorageManagementClient
 import azure.mgmt.storage.models as azstm
@@ -33,7 +48,16 @@ from azure.search.documents.indexes.models import (
     FieldMapping,
     OutputFieldMappingEntry
 )
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from azure.mgmt.core.polling.arm_polling import ARMPolling
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+logger = logging.getLogger(__name__)
+
+
+def set_log_level(level: Optional[str] = None) -> None:
+    """Set the module log level, defaulting to the AZWRAP_LOG_LEVEL env var."""
+    logger.setLevel((level or os.getenv('AZWRAP_LOG_LEVEL', 'WARNING')).upper())
+
 class Identity:
     """Azure Identity for authentication.
 
@@ -196,7 +220,7 @@ class ResourceGroup:
         except AzureResourceNotFoundError as e:
             raise ResourceNotFoundError(f"Storage account with name {account_name} not found. \n {str(e)}")
         except Exception as e:
-            print(f"Error at ResourceGroup.get_storage_account({account_name = }): {str(e)}")
+            logger.exception(f"Error at ResourceGroup.get_storage_account({account_name = })")
             raise e
         if account is None:
             raise ValueError(f"Storage account with name {account_name} not found.")
@@ -570,6 +594,13 @@ class BlobType(Enum):
         # No match found
         return None
 
+# Text-based blob types that are decoded/processed as plain text
+_TEXT_TYPES: frozenset = frozenset({
+    BlobType.TEXT_PLAIN, BlobType.TEXT_CSV, BlobType.TEXT_HTML,
+    BlobType.TEXT_CSS, BlobType.TEXT_JAVASCRIPT, BlobType.TEXT_XML,
+    BlobType.TEXT_MARKDOWN, BlobType.APP_JSON, BlobType.APP_XML
+})
+
 class Container:
     container_client: ContainerClient
     storage_account: StorageAccount
@@ -620,9 +651,7 @@ class Container:
             
         # Process based on MIME type
         try:
-            if blob_type in [BlobType.TEXT_PLAIN, BlobType.TEXT_CSV, BlobType.TEXT_HTML, 
-                            BlobType.TEXT_CSS, BlobType.TEXT_JAVASCRIPT, BlobType.TEXT_XML, 
-                            BlobType.TEXT_MARKDOWN, BlobType.APP_JSON, BlobType.APP_XML]:
+            if blob_type in _TEXT_TYPES:
                 # Text-based formats
                 text = content.decode('utf-8')
                 return text
@@ -820,7 +849,7 @@ class Container:
             
             return matching_blobs
         except Exception as e:
-            print(f"Error searching for blobs with filename '{filename}': {str(e)}")
+            logger.exception(f"Error searching for blobs with filename '{filename}'")
             raise e
                        
     def get_blob_type_from_properties(self, properties: BlobProperties) -> Optional["BlobType"]:
@@ -895,9 +924,7 @@ class Container:
             
         # Process based on MIME type
         try:
-            if blob_type in [BlobType.TEXT_PLAIN, BlobType.TEXT_CSV, BlobType.TEXT_HTML, 
-                            BlobType.TEXT_CSS, BlobType.TEXT_JAVASCRIPT, BlobType.TEXT_XML, 
-                            BlobType.TEXT_MARKDOWN, BlobType.APP_JSON, BlobType.APP_XML]:
+            if blob_type in _TEXT_TYPES:
                 # Text-based formats
                 return self.get_text_content(blob_name)
                 
@@ -914,11 +941,11 @@ class Container:
                     pdf_file = BytesIO(content_bytes)
                     pdf_reader = PyPDF2.PdfReader(pdf_file)
                     
-                    text = ""
-                    for page_num in range(len(pdf_reader.pages)):
-                        text += pdf_reader.pages[page_num].extract_text()
-                    
-                    return text
+                    # Collect page texts and join once; repeated string
+                    # concatenation is quadratic in the worst case
+                    parts = [page.extract_text() or "" for page in pdf_reader.pages]
+
+                    return "\n".join(parts)
                 except ImportError:
                     raise ImportError("The PyPDF2 package is required to read PDF files. Install it with 'pip install PyPDF2'")
                     
@@ -938,7 +965,7 @@ class Container:
                 return self.get_blob_content(blob_name)
                 
         except Exception as e:
-            print(f"Error processing blob {blob_name} as {blob_type.name}: {str(e)}")
+            logger.exception(f"Error processing blob {blob_name} as {blob_type.name}")
             raise e
 
     def get_folder_structure(self) -> Dict[str, List[str]]:
@@ -1076,6 +1103,25 @@ class Container:
         # Return properties of the uploaded blob
         return blob_properties
 
+if orjson is not None:
+    # orjson serializes large str-to-str mappings several times faster than
+    # the stdlib json module
+    def _dump_mapping(mapping: Dict[str, str], path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+
+    def _load_mapping(path: str) -> Dict[str, str]:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+else:
+    def _dump_mapping(mapping: Dict[str, str], path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(mapping, f, indent=2)
+
+    def _load_mapping(path: str) -> Dict[str, str]:
+        with open(path, 'r') as f:
+            return json.load(f)
+
 class FolderProcessingResults:
     file_mappings: Dict[str, str]
     uuid_to_original: Dict[str, str]
@@ -1083,24 +1129,17 @@ class FolderProcessingResults:
         self.file_mappings = file_mappings
         self.uuid_to_original = uuid_to_original
 
-    import json
     def store_mapping(self, mapping_file: str) -> None:
-        with open(mapping_file, 'w') as f:
-            json.dump(self.file_mappings, f, indent=2)
-    
+        _dump_mapping(self.file_mappings, mapping_file)
+
     def store_uuid_mapping(self, uuid_mapping_file: str) -> None:
-        with open(uuid_mapping_file, 'w') as f:
-            json.dump(self.uuid_to_original, f, indent=2)
-    
+        _dump_mapping(self.uuid_to_original, uuid_mapping_file)
+
     def load_file_mapping(self, mapping_file: str) -> None:
-        with open(mapping_file, 'r') as f:
-            mappings = json.load(f)
-        self.file_mappings = mappings
-    
+        self.file_mappings = _load_mapping(mapping_file)
+
     def load_uuid_mapping(self, uuid_mapping_file: str) -> None:
-        with open(uuid_mapping_file, 'r') as f:
-            uuid_mappings = json.load(f)
-        self.uuid_to_original = uuid_mappings
+        self.uuid_to_original = _load_mapping(uuid_mapping_file)
 
     def load_mappings(self, mapping_file: str, uuid_mapping_file: str) -> None:
         self.load_file_mapping(mapping_file)
@@ -1112,6 +1151,17 @@ class FolderProcessingResults:
     def get_original_filename(self, uuid_filename: str) -> Optional[str]:
         return self.uuid_to_original.get(uuid_filename, None)
 
+import uuid
+import mimetypes
+
+# Precomputed extension -> content-type lookup so bulk uploads avoid the
+# per-call path parsing inside mimetypes.guess_type
+mimetypes.init()
+_EXT_TO_MIME: Dict[str, str] = dict(mimetypes.types_map)
+
+# Matches canonical UUID filenames (e.g. "123e4567-e89b-12d3-a456-426614174000")
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
+
 class FolderProcessor:
     localfolder: str
 
@@ -1119,13 +1169,12 @@ class FolderProcessor:
         # Validate the local directory
         if not os.path.isdir(folder):
             raise ValueError(f"The directory '{folder}' does not exist or is not a directory")
-        self.localfolder = folder    
+        self.localfolder = folder
 
     def get_uuid_filename( filename: str) -> str:
-        import uuid
         # Get file extension
         file_name, file_ext = os.path.splitext(filename)
-        if file_name == str(uuid.UUID(file_name)):
+        if _UUID_RE.match(file_name):
             # If the filename is already a UUID, keep it as is
             uuid_filename = file_name + file_ext
         else:
@@ -1153,7 +1202,8 @@ class FolderProcessor:
                         extensions_filter: Optional[List[str]] = None,
                         use_uuid: bool = True,
                         overwrite: bool = False,
-                        record_mappings: bool = True) -> Dict[str, str]:
+                        record_mappings: bool = True,
+                        max_workers: int = 8) -> Dict[str, str]:
         """
         Upload all files from a local directory to the container, either preserving the folder 
         structure or flattening all files into a single container folder.
@@ -1166,7 +1216,8 @@ class FolderProcessor:
             use_uuid: If True, replaces filenames with UUIDs; if False, keeps original filenames
             overwrite: Whether to overwrite if files already exist
             record_mappings: Whether to create a mapping file relating original names to UUIDs
-            
+            max_workers: Number of concurrent upload threads
+
         Returns:
             Dict mapping original file paths to their destination blob paths
         
@@ -1174,79 +1225,102 @@ class FolderProcessor:
             ValueError: If the local directory doesn't exist or if upload fails
         """
         
+        from azure.storage.blob import ContentSettings
+
         # Normalize the container folder (ensure it ends with a slash if not empty)
         if container_folder and not container_folder.endswith('/'):
             container_folder = container_folder + '/'
-        
+
         # Initialize mapping of original files to blob paths
         file_mappings = {}
-        
+
         # Keep a mapping of UUIDs to original filenames if using UUIDs
         uuid_to_original = {}
 
-                
-        # Walk through the directory structure
-        for root, _, files in os.walk(self.local_directory):
+        # Phase 1: walk the directory and build the per-file upload tasks
+        # (local path, relative path, destination path, content type) without
+        # touching the network, so phase 2 is pure I/O.
+        tasks: List[Tuple[str, str, str, Optional[str]]] = []
+
+        for root, _, files in os.walk(self.localfolder):
             # Filter files by extension if specified
             if extensions_filter:
                 files = [f for f in files if any(f.lower().endswith(ext.lower()) for ext in extensions_filter)]
-            
+
             for filename in files:
                 # Get the full local file path
                 local_file_path = os.path.join(root, filename)
                 # Determine relative path from the base directory
-                rel_path = os.path.relpath(local_file_path, self.local_directory)
+                rel_path = os.path.relpath(local_file_path, self.localfolder)
                 # Generate a UUID for the file if requested
                 if use_uuid:
+                    uuid_filename = FolderProcessor.get_uuid_filename(filename)
                     # Store mapping
-                    uuid_to_original[FolderProcessor.get_uuid_filename(filename)] = rel_path
+                    uuid_to_original[uuid_filename] = rel_path
                 else:
                     uuid_filename = filename
-                
+
                 # Determine the destination blob path
                 if maintain_structure:
                     # Keep folder structure: container_folder + relative_path (with UUID filename)
-                    rel_dir = os.path.dirname(rel_path)
                     dest_path = FolderProcessor.get_dest_path(container_folder, rel_path, uuid_filename)
                 else:
                     # Flatten structure: all files go directly to container_folder
                     dest_path = f"{container_folder}{uuid_filename}"
-                
-                import mimetypes
-                # Detect content type
-                content_type, _ = mimetypes.guess_type(local_file_path)
-                
-                # Create a blob client for the destination path
-                blob_client = self.container_client.get_blob_client(dest_path)
-                
-                # Set content settings if content type was detected
-                content_settings = None
-                if content_type:
-                    from azure.storage.blob import ContentSettings
-                    content_settings = ContentSettings(content_type=content_type)
-                
-                # Upload the file
-                with open(local_file_path, "rb") as data:
-                    blob_client.upload_blob(data, overwrite=overwrite, content_settings=content_settings)
-                
-                # Store the mapping
-                file_mappings[rel_path] = dest_path
-                
-                print(f"Uploaded: {rel_path} -> {dest_path}")
-        
-        # If using UUIDs, create a mapping file in the container
-        if use_uuid and record_mappings:
-            # Create a JSON mapping file
+
+                # Detect content type from the extension
+                ext = os.path.splitext(filename)[1].lower()
+                content_type = _EXT_TO_MIME.get(ext)
+
+                tasks.append((local_file_path, rel_path, dest_path, content_type))
+
+        # Phase 2: perform the blob uploads only
+        def upload_task(local_file_path: str, rel_path: str, dest_path: str, content_type: Optional[str]) -> None:
+            # Create a blob client for the destination path
+            blob_client = container.container_client.get_blob_client(dest_path)
+
+            # Set content settings if content type was detected
+            content_settings = None
+            if content_type:
+                content_settings = ContentSettings(content_type=content_type)
+
+            # Upload the file
+            with open(local_file_path, "rb") as data:
+                blob_client.upload_blob(data, overwrite=overwrite, content_settings=content_settings)
+
+            print(f"Uploaded: {rel_path} -> {dest_path}")
+
+        def upload_mapping() -> None:
+            # Create a JSON mapping file in the container
             mapping_blob_name = f"{container_folder}file_mappings.json"
-            mapping_blob = self.container_client.get_blob_client(mapping_blob_name)
-            
+            mapping_blob = container.container_client.get_blob_client(mapping_blob_name)
+
             # Convert mapping to JSON
             mapping_json = json.dumps(uuid_to_original, indent=2)
-            
+
             # Upload the mapping file
             mapping_blob.upload_blob(mapping_json, overwrite=True, content_settings=ContentSettings(content_type="application/json"))
             print(f"Created mapping file: {mapping_blob_name}")
-        
+
+        # All destination paths are known up front, so the mapping can be
+        # recorded before any upload completes
+        for _, rel_path, dest_path, _ in tasks:
+            file_mappings[rel_path] = dest_path
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(upload_task, *task) for task in tasks]
+
+            # The mapping contents are known once all file tasks are submitted,
+            # so its upload overlaps with the final file uploads instead of
+            # adding a serial round-trip at the end
+            if use_uuid and record_mappings:
+                futures.append(ex.submit(upload_mapping))
+
+            for future in as_completed(futures):
+                future.result()
+
         return FolderProcessingResults( file_mappings=file_mappings, uuid_to_original=uuid_to_original)
 
     # def download_files_with_mapping(self, 
@@ -1343,11 +1417,34 @@ import azure.search.documents.indexes as azsdi
 import azure.search.documents.indexes.models as azsdim
 from azure.search.documents.indexes import SearchIndexerClient
 from azure.core.credentials import AzureKeyCredential
-from docx import Document
 from io import BytesIO
 
-from openai import AzureOpenAI
-from langchain_openai import AzureChatOpenAI
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI, APIConnectionError, APITimeoutError, RateLimitError
+from tenacity import wait_exponential_jitter
+
+# Transient OpenAI failures worth retrying; auth and bad-request errors
+# should surface immediately
+_OPENAI_TRANSIENT_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+
+# Shared keepalive connection pools for all AzureOpenAI clients created by
+# the factories below; without them every client builds its own transport
+# and pays fresh TCP/TLS handshakes instead of reusing warm connections
+_HTTPX_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+_shared_http_client: Optional[httpx.Client] = None
+_shared_async_http_client: Optional[httpx.AsyncClient] = None
+
+def _get_shared_http_client() -> httpx.Client:
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = httpx.Client(limits=_HTTPX_LIMITS)
+    return _shared_http_client
+
+def _get_shared_async_http_client() -> httpx.AsyncClient:
+    global _shared_async_http_client
+    if _shared_async_http_client is None:
+        _shared_async_http_client = httpx.AsyncClient(limits=_HTTPX_LIMITS)
+    return _shared_async_http_client
 
 class AIService:
     cognitive_client: CognitiveServicesManagementClient
@@ -1355,22 +1452,37 @@ class AIService:
     resource_group: ResourceGroup
     
     
-    def __init__(self, 
+    def __init__(self,
                  resource_group: ResourceGroup,
                  cognitive_client: CognitiveServicesManagementClient,
                  azure_Account: azcsm.Account):
         self.resource_group = resource_group
         self.cognitive_client = cognitive_client
         self.azure_account = azure_Account
-        
+        # Short-lived cache of the batched deployment list so per-name
+        # lookups do not issue one ARM round-trip each
+        self._deployments_cache: Optional[Tuple[float, List[azcsm.Deployment]]] = None
+        self._deployments_ttl = 30
+
     def get_OpenAIClient(self, api_version:str) -> "OpenAIClient" :
         keys = self.cognitive_client.accounts.list_keys(self.resource_group.get_name(), self.azure_account.name)
         openai_client = AzureOpenAI(
             api_key=keys.key1,
             api_version=api_version,
             azure_endpoint= f"https://{self.azure_account.name}.openai.azure.com/",
+            http_client=_get_shared_http_client(),
+        )
+        return OpenAIClient(self, openai_client)
+
+    def get_AsyncOpenAIClient(self, api_version:str) -> "AsyncOpenAIClient" :
+        keys = self.cognitive_client.accounts.list_keys(self.resource_group.get_name(), self.azure_account.name)
+        openai_client = AsyncAzureOpenAI(
+            api_key=keys.key1,
+            api_version=api_version,
+            azure_endpoint= f"https://{self.azure_account.name}.openai.azure.com/",
+            http_client=_get_shared_async_http_client(),
         )
-        return OpenAIClient(self, openai_client) 
+        return AsyncOpenAIClient(self, openai_client)
 
     def get_models(self, azure_location: str = None) -> List[azcsm.Model]:
         if (azure_location is None): 
@@ -1400,21 +1512,30 @@ class AIService:
             }
             return info
         except Exception as e:
-            print(f"Error getting model '{model.model.name}': {str(e)}")
+            logger.exception(f"Error getting model '{model.model.name}'")
             return {}
 
     def get_deployments(self) -> List[azcsm.Deployment]:
+        if self._deployments_cache is not None:
+            cached_at, deployments = self._deployments_cache
+            if monotonic() - cached_at < self._deployments_ttl:
+                return deployments
         try:
             deployments = list(self.cognitive_client.deployments.list(self.resource_group.get_name(), self.azure_account.name))
-            
-            result = [ deployment for deployment in deployments ]
-            return result
+            self._deployments_cache = (monotonic(), deployments)
+            return deployments
         except Exception as e:
-            print(f"Error listing deployments: {str(e)}")
+            logger.exception("Error listing deployments")
             return []
-        
-    def get_deployment(self, deployment_name:str) -> azcsm.Deployment : 
-            deployment = self.cognitive_client.deployments.get( resource_group_name=self.resource_group.get_name(), account_name=self.azure_account.name, deployment_name=deployment_name )        
+
+    def get_deployment(self, deployment_name:str) -> azcsm.Deployment :
+            # Resolve from the batched deployment list first; callers looping
+            # over names then pay a single list call instead of one GET each
+            for deployment in self.get_deployments():
+                if deployment.name == deployment_name:
+                    return deployment
+            # Fall back to a point GET in case the cached list is stale
+            deployment = self.cognitive_client.deployments.get( resource_group_name=self.resource_group.get_name(), account_name=self.azure_account.name, deployment_name=deployment_name )
             return deployment
 
     @staticmethod        
@@ -1428,162 +1549,240 @@ class AIService:
         Returns:
             Dictionary with deployment details
         """
-        try:
-            # Handle missing properties safely
-            deployment_info = {
-                "name": deployment.name if hasattr(deployment, 'name') else "name not found",
-                "status": "unknown"
+        # Handle missing properties safely with getattr defaults instead of
+        # a hasattr probe per field
+        deployment_info = {
+            "name": getattr(deployment, 'name', None) or "name not found",
+            "status": "unknown"
+        }
+        props = getattr(deployment, 'properties', None)
+        if props is not None:
+            optional_fields = {
+                "model": getattr(props, 'model', None),
+                "status": getattr(props, 'provisioning_state', None),
+                "created_at": getattr(props, 'created_at', None),
+                "last_modified": getattr(props, 'last_modified', None),
             }
-            # Add properties only if they exist
-            if hasattr(deployment, 'properties'):
-                props = deployment.properties
-                if hasattr(props, 'model'):
-                    deployment_info["model"] = props.model
-                if hasattr(props, 'provisioning_state'):
-                    deployment_info["status"] = props.provisioning_state
-                # Handle scale settings if they exist
-                if hasattr(props, 'scale_settings') and props.scale_settings is not None:
-                    scale_settings = {}
-                    if hasattr(props.scale_settings, 'scale_type'):
-                        scale_settings["scale_type"] = props.scale_settings.scale_type
-                    if hasattr(props.scale_settings, 'capacity'):
-                        scale_settings["capacity"] = props.scale_settings.capacity
-                    deployment_info["scale_settings"] = scale_settings
-                # Add timestamps if they exist
-                if hasattr(props, 'created_at'):
-                    deployment_info["created_at"] = props.created_at
-                if hasattr(props, 'last_modified'):
-                    deployment_info["last_modified"] = props.last_modified
-            return deployment_info
-            
-        except Exception as e:
-            print(f"Error getting deployment '{deployment.name}': {str(e)}")
-            return {}
+            deployment_info.update({key: value for key, value in optional_fields.items() if value is not None})
+
+            # Handle scale settings if they exist
+            scale_settings = getattr(props, 'scale_settings', None)
+            if scale_settings is not None:
+                scale_fields = {
+                    "scale_type": getattr(scale_settings, 'scale_type', None),
+                    "capacity": getattr(scale_settings, 'capacity', None),
+                }
+                deployment_info["scale_settings"] = {key: value for key, value in scale_fields.items() if value is not None}
+        return deployment_info
+
+    def create_deployment_begin(self,
+                                deployment_name: str,
+                                model_name: str,
+                                model_version: str = None,
+                                sku_name: str = "Standard",
+                                capacity: int = 1,
+                                polling_interval: float = 5.0) -> LROPoller:
+        """
+        Start creating a model deployment without waiting for completion.
+
+        Args:
+            deployment_name: Name for the new deployment
+            model_name: Base model name (e.g., 'gpt-4', 'text-embedding-ada-002')
+            model_version: Optional model version
+            sku_name: SKU name (Standard, Manual)
+            capacity: Number of tokens per minute in millions (TPM)
+            polling_interval: Seconds between LRO status polls; small deployments
+                finish in seconds, so this beats the SDK's ~30s default. Use a
+                larger value for long-running operations to avoid throttling.
+
+        Returns:
+            LROPoller for the create operation; pass it to await_deployment()
+        """
+        if model_version:
+            model = azcsm.Model(name=model_name, version=model_version)
+        else:
+            model = azcsm.Model(name=model_name)
+
+        deployment_properties = azcsm.DeploymentProperties(model=model)
+
+        # Create SKU configuration
+        sku = azcsm.Sku(name=sku_name, capacity=capacity)
+
+        return self.cognitive_client.deployments.begin_create_or_update(
+            resource_group_name=self.resource_group.get_name(),
+            account_name=self.azure_account.name,
+            deployment_name=deployment_name,
+            deployment=None,
+            parameters = {
+                "properties": deployment_properties,
+                "sku": sku
+            },
+            polling=ARMPolling(timeout=polling_interval)
+        )
+
+    def delete_deployment_begin(self, deployment_name: str, polling_interval: float = 5.0) -> LROPoller:
+        """
+        Start deleting a model deployment without waiting for completion.
+
+        Args:
+            deployment_name: Name of the deployment to delete
+            polling_interval: Seconds between LRO status polls
+
+        Returns:
+            LROPoller for the delete operation; pass it to await_deployment()
+        """
+        return self.cognitive_client.deployments.begin_delete(
+            resource_group_name=self.resource_group.get_name(),
+            account_name=self.azure_account.name,
+            deployment_name=deployment_name,
+            polling=ARMPolling(timeout=polling_interval)
+        )
 
-    def create_deployment(self, 
-                         deployment_name: str, 
-                         model_name: str, 
+    def update_deployment_begin(self,
+                                deployment_name: str,
+                                sku_name: str = "Standard",
+                                capacity: int = 1,
+                                polling_interval: float = 5.0,
+                                model_name: Optional[str] = None,
+                                model_version: Optional[str] = None,
+                                current_deployment: Optional[azcsm.Deployment] = None) -> LROPoller:
+        """
+        Start updating a model deployment without waiting for completion.
+
+        The existing deployment is fetched only to read its model name and
+        version; callers iterating many deployments via get_deployments()
+        should pass the cached object (or the model fields directly) to save
+        one ARM round-trip per update.
+
+        Args:
+            deployment_name: Name of the deployment to update
+            sku_name: New SKU name
+            capacity: New capacity value
+            polling_interval: Seconds between LRO status polls
+            model_name: Model name to keep, skipping the lookup when given
+            model_version: Optional model version accompanying model_name
+            current_deployment: Already-fetched deployment to read the model from
+
+        Returns:
+            LROPoller for the update operation; pass it to await_deployment()
+        """
+        if model_name is not None:
+            model = azcsm.Model(name=model_name, version=model_version)
+        else:
+            deployment = current_deployment if current_deployment is not None else self.get_deployment(deployment_name)
+            model_props = deployment.properties.model
+            model = azcsm.Model(
+                # If the model is stored as a complex object, preserve its name/version
+                name=model_props.name if hasattr(model_props, 'name') else model_props,
+                version=model_props.version if hasattr(model_props, 'version') else None
+            )
+        updated_sku = azcsm.Sku(name=sku_name, capacity=capacity)
+
+        deployment_properties = azcsm.DeploymentProperties(model=model)
+
+        return self.cognitive_client.deployments.begin_create_or_update(
+            self.resource_group.get_name(),
+            self.azure_account.name,
+            deployment_name,
+            parameters={
+                "properties": deployment_properties,
+                "sku": updated_sku
+            },
+            polling=ARMPolling(timeout=polling_interval)
+        )
+
+    @staticmethod
+    def await_deployment(poller: LROPoller, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a deployment operation started with a begin_* method.
+
+        Args:
+            poller: LROPoller returned by a begin_* method
+            timeout: Optional number of seconds to wait before raising
+
+        Returns:
+            The operation result (a Deployment for create/update, None for delete)
+        """
+        return poller.result(timeout=timeout)
+
+    def create_deployment(self,
+                         deployment_name: str,
+                         model_name: str,
                          model_version:str = None,
                          sku_name: str = "Standard",
-                         capacity: int = 1) -> Union[azcsm.Deployment, Dict[str, str]]:
+                         capacity: int = 1,
+                         polling_interval: float = 5.0) -> Union[azcsm.Deployment, Dict[str, str]]:
         """
         Create a new model deployment in Azure OpenAI.
-        
+
         Args:
             deployment_name: Name for the new deployment
             model: Base model name (e.g., 'gpt-4', 'text-embedding-ada-002')
             capacity: Number of tokens per minute in millions (TPM)
             scale_type: Scaling type (Standard, Manual)
-            
+            polling_interval: Seconds between LRO status polls
+
         Returns:
             the Deployment when prepared
         """
-
         try:
-            if model_version:
-                model = azcsm.Model(name=model_name, version=model_version)
-            else:
-                model = azcsm.Model(name=model_name)
-
-            deployment_properties = azcsm.DeploymentProperties(model=model)
-            
-            # Create SKU configuration
-            sku = azcsm.Sku(name=sku_name, capacity=capacity)
-
-            # properties = azcsm.DeploymentProperties(
-
-            #     model=model,
-            #     scale_settings=azcsm.DeploymentScaleSettings(
-            #         scale_type=scale_type,
-            #         capacity=capacity
-            #     ),
-            #     rai_policy_name="Microsoft.Default"
-            # )
-            poller = self.cognitive_client.deployments.begin_create_or_update(
-                resource_group_name=self.resource_group.get_name(),
-                account_name=self.azure_account.name,
-                deployment_name=deployment_name,
-                deployment=None, 
-                parameters = { 
-                    "properties": deployment_properties,
-                    "sku": sku
-                }
-            )
-            deployment: azcsm.Deployment = poller.result()
+            poller = self.create_deployment_begin(deployment_name, model_name, model_version, sku_name, capacity, polling_interval)
+            deployment: azcsm.Deployment = self.await_deployment(poller)
             return deployment
-            
         except Exception as e:
-            print(f"Error creating deployment '{deployment_name}': {str(e)}")
+            logger.exception(f"Error creating deployment '{deployment_name}'")
             return {"error": str(e)}
 
-    def delete_deployment(self, deployment_name: str) -> bool:
+    def delete_deployment(self, deployment_name: str, polling_interval: float = 5.0) -> bool:
         """
         Delete a model deployment in Azure OpenAI.
-        
+
         Args:
             deployment_name: Name of the deployment to delete
-            
+            polling_interval: Seconds between LRO status polls
+
         Returns:
             Boolean indicating success or failure
         """
         try:
-            # Start the delete operation
-            poller = self.cognitive_client.deployments.begin_delete(
-                resource_group_name=self.resource_group.get_name(),
-                account_name=self.azure_account.name,
-                deployment_name=deployment_name
-            )
-            
-            # Wait for the operation to complete
-            result = poller.result()
-
+            poller = self.delete_deployment_begin(deployment_name, polling_interval)
+            self.await_deployment(poller)
             print(f"Successfully deleted deployment '{deployment_name}'")
             return True
         except Exception as e:
-            print(f"Error deleting deployment '{deployment_name}': {str(e)}")
+            logger.exception(f"Error deleting deployment '{deployment_name}'")
             return False
 
-    def update_deployment(self, 
-                         deployment_name: str, 
+    def update_deployment(self,
+                         deployment_name: str,
                          sku_name: str = "Standard",
-                         capacity: int = 1) -> Union[azcsm.Deployment, Dict[str, str]]:
+                         capacity: int = 1,
+                         polling_interval: float = 5.0,
+                         model_name: Optional[str] = None,
+                         model_version: Optional[str] = None,
+                         current_deployment: Optional[azcsm.Deployment] = None) -> Union[azcsm.Deployment, Dict[str, str]]:
         """
         Update an existing model deployment in Azure OpenAI.
-        
+
         Args:
             deployment_name: Name of the deployment to update
             capacity: New capacity value (optional)
             scale_type: New scale type (optional)
-            
+            polling_interval: Seconds between LRO status polls
+            model_name: Model name to keep, skipping the per-update lookup
+            model_version: Optional model version accompanying model_name
+            current_deployment: Already-fetched deployment to read the model from
+
         Returns:
             Dictionary with deployment details
         """
         try:
-            deployment = self.get_deployment(deployment_name)
-
-            model_props = deployment.properties.model
-            model = azcsm.Model(
-                # If the model is stored as a complex object, preserve its name/version
-                name=model_props.name if hasattr(model_props, 'name') else model_props,
-                version=model_props.version if hasattr(model_props, 'version') else None
-            )            
-            updated_sku = azcsm.Sku(name=sku_name, capacity=capacity)
-
-            deployment_properties = azcsm.DeploymentProperties(model=model)
-
-            poller = self.cognitive_client.deployments.begin_create_or_update(
-                self.resource_group.get_name(),
-                self.azure_account.name,
-                deployment_name,
-                parameters={
-                    "properties": deployment_properties,
-                    "sku": updated_sku
-                }
-            )            
-            deployment = poller.result()
+            poller = self.update_deployment_begin(deployment_name, sku_name, capacity, polling_interval,
+                                                  model_name, model_version, current_deployment)
+            deployment = self.await_deployment(poller)
             return deployment
         except Exception as e:
-            print(f"Error updating deployment '{deployment_name}': {str(e)}")
+            logger.exception(f"Error updating deployment '{deployment_name}'")
             return {"error": str(e)}
 
 
@@ -1607,7 +1806,6 @@ class DocumentIntelligenceService:
     kind: str
     sku: str
     id: str
-    _credential: Optional[AzureKeyCredential]
     
     def __init__(self, 
                  resource_group: ResourceGroup,
@@ -1623,9 +1821,18 @@ class DocumentIntelligenceService:
         self.sku = azure_account.sku.name if hasattr(azure_account, 'sku') and hasattr(azure_account.sku, 'name') else "unknown"
         self.id = azure_account.id
         
-        # Initialize credential (lazy loading - will be set when get_credential is called)
-        self._credential = None
-        
+        # Cached API keys with a short TTL; keys rotate infrequently so
+        # repeated get_keys calls need not hit ARM every time
+        self._keys_cache: Optional[Tuple[float, Dict[str, str]]] = None
+        self._keys_ttl = 300
+
+        # Shared HTTP transport and cached client wrappers (lazy loading)
+        self._transport = None
+        self._doc_analysis_wrapper: Optional["DocumentAnalysisClientWrapper"] = None
+        self._doc_intelligence_wrapper: Optional["DocumentIntelligenceClientWrapper"] = None
+        self._formrecognizer_models_wrapper: Optional["FormRecognizerModels"] = None
+        self._doc_intelligence_models_wrapper: Optional["DocumentIntelligenceModels"] = None
+
     def get_name(self) -> str:
         """Get the name of the Document Intelligence service.
         
@@ -1676,81 +1883,169 @@ class DocumentIntelligenceService:
     
     def get_keys(self) -> Dict[str, str]:
         """Get the API keys for the Document Intelligence service.
-        
+
+        The keys are cached for a short TTL so repeated calls avoid the
+        ARM list_keys round-trip.
+
         Returns:
             Dictionary containing primary and secondary keys
         """
-        keys = self.cognitive_client.accounts.list_keys(
-            self.resource_group.get_name(), 
+        if self._keys_cache is not None:
+            cached_at, keys = self._keys_cache
+            if monotonic() - cached_at < self._keys_ttl:
+                return keys
+        response = self.cognitive_client.accounts.list_keys(
+            self.resource_group.get_name(),
             self.azure_account.name
         )
-        return {"primary": keys.key1, "secondary": keys.key2}
-    
+        keys = {"primary": response.key1, "secondary": response.key2}
+        self._keys_cache = (monotonic(), keys)
+        return keys
+
+    @cached_property
+    def credential(self) -> AzureKeyCredential:
+        """Azure credential for Document Intelligence.
+
+        Built on first access and cached on the instance, so subsequent
+        reads are a plain attribute load.
+        """
+        return AzureKeyCredential(self.get_keys()["primary"])
+
     def get_credential(self) -> AzureKeyCredential:
         """Get an Azure credential for Document Intelligence.
-        
+
         Returns:
             AzureKeyCredential object for authenticating to the Document Intelligence service
         """
-        # Use cached credential if available
-        if self._credential is None:
-            keys = self.cognitive_client.accounts.list_keys(self.resource_group.get_name(), self.azure_account.name)
-            self._credential = AzureKeyCredential(keys.key1)
-        return self._credential
+        return self.credential
     
+    def get_transport(self):
+        """Get the shared HTTP transport for clients of this service.
+
+        All clients created by this service reuse one keep-alive session so
+        back-to-back calls avoid repeated TCP and TLS handshakes.
+
+        Returns:
+            RequestsTransport backed by a pooled requests.Session
+        """
+        if self._transport is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from azure.core.pipeline.transport import RequestsTransport
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._transport = RequestsTransport(session=session, session_owner=False)
+        return self._transport
+
     def get_document_analysis_client(self) -> "DocumentAnalysisClientWrapper":
         """Get a Document Analysis client for analyzing documents.
-        
+
+        The wrapper is created once and cached, and its client uses the
+        service's shared HTTP transport.
+
         Returns:
-            DocumentIntelligenceClientWrapper object for analyzing documents
+            DocumentAnalysisClientWrapper object for analyzing documents
         """
-        client = DocumentAnalysisClient(
+        if self._doc_analysis_wrapper is None:
+            client = DocumentAnalysisClient(
+                endpoint=self.endpoint,
+                credential=self.credential,
+                transport=self.get_transport()
+            )
+            self._doc_analysis_wrapper = DocumentAnalysisClientWrapper(self, client)
+        return self._doc_analysis_wrapper
+
+    def get_async_document_analysis_client(self) -> "AsyncDocumentAnalysisClientWrapper":
+        """Get an async Document Analysis client for analyzing documents.
+
+        A fresh wrapper is returned each call because the async client binds
+        to the running event loop; close it with `await wrapper.close()` or
+        use it as an async context manager.
+
+        Returns:
+            AsyncDocumentAnalysisClientWrapper object for analyzing documents
+        """
+        from azure.ai.formrecognizer.aio import DocumentAnalysisClient as AsyncDocumentAnalysisClient
+        client = AsyncDocumentAnalysisClient(
             endpoint=self.endpoint,
-            credential=self.get_credential()
+            credential=self.credential
         )
-        
-        return DocumentAnalysisClientWrapper(self, client)
-    
+        return AsyncDocumentAnalysisClientWrapper(self, client)
+
     def get_document_intelligence_client(self) -> "DocumentIntelligenceClientWrapper":
-        """Get a Document Analysis client for analyzing documents.
-        
+        """Get a Document Intelligence client for analyzing documents.
+
+        The wrapper is created once and cached, and its client uses the
+        service's shared HTTP transport.
+
         Returns:
             DocumentIntelligenceClientWrapper object for analyzing documents
         """
-        client = DocumentIntelligenceClient(
-            endpoint=self.endpoint,
-            credential=self.get_credential()
-        )
-        
-        return DocumentIntelligenceClientWrapper(self, client) 
+        if self._doc_intelligence_wrapper is None:
+            client = DocumentIntelligenceClient(
+                endpoint=self.endpoint,
+                credential=self.credential,
+                transport=self.get_transport()
+            )
+            self._doc_intelligence_wrapper = DocumentIntelligenceClientWrapper(self, client)
+        return self._doc_intelligence_wrapper
     
     def get_formrecognizer_models_client(self) -> "FormRecognizerModels":
-        """Get a Document Analysis client for analyzing documents.
-        
+        """Get a Form Recognizer model administration client.
+
+        The wrapper is created once and cached so repeated calls reuse the
+        same client.
+
         Returns:
-            DocumentIntelligenceClientWrapper object for analyzing documents
+            FormRecognizerModels object for managing custom models
         """
+        if self._formrecognizer_models_wrapper is None:
+            client = DocumentModelAdministrationClient(
+                endpoint=self.endpoint,
+                credential=self.credential
+            )
+            self._formrecognizer_models_wrapper = FormRecognizerModels(self, client)
+        return self._formrecognizer_models_wrapper
 
-        client = DocumentModelAdministrationClient( 
-            endpoint=self.endpoint,
-            credential=self.get_credential()
-        )
-        
-        return FormRecognizerModels(self, client)
-    
     def get_document_intelligence_models_client(self) -> "DocumentIntelligenceModels":
-        """Get a Document Analysis client for analyzing documents.
-        
+        """Get a Document Intelligence model administration client.
+
+        The wrapper is created once and cached so repeated calls reuse the
+        same client.
+
         Returns:
-            DocumentIntelligenceClientWrapper object for analyzing documents
+            DocumentIntelligenceModels object for managing custom models
         """
-
-        client = DocumentIntelligenceAdministrationClient( 
-            endpoint=self.endpoint,
-            credential=self.get_credential()
-        )
-        
-        return DocumentIntelligenceModels(self, client)
+        if self._doc_intelligence_models_wrapper is None:
+            client = DocumentIntelligenceAdministrationClient(
+                endpoint=self.endpoint,
+                credential=self.credential
+            )
+            self._doc_intelligence_models_wrapper = DocumentIntelligenceModels(self, client)
+        return self._doc_intelligence_models_wrapper
+
+
+# Prebuilt model ids served by the analyze_* convenience shims; keeping them
+# in one dict leaves a single retry-decorated code path in analyze_document
+PREBUILT_MODELS: Dict[str, str] = {
+    "layout": "prebuilt-layout",
+    "receipt": "prebuilt-receipt",
+    "invoice": "prebuilt-invoice",
+    "id_document": "prebuilt-idDocument",
+    "business_card": "prebuilt-businessCard",
+    "w2": "prebuilt-tax.us.w2",
+    "1098": "prebuilt-tax.us.1098",
+    "1099": "prebuilt-tax.us.1099",
+    "health_insurance_card": "prebuilt-healthInsuranceCard.us",
+    "marriage_certificate": "prebuilt-marriageCertificate.us",
+    "mortgage_document": "prebuilt-mortgage.us",
+    "pay_stub": "prebuilt-payStub.us",
+    "bank_check": "prebuilt-check.us",
+    "vaccination_card": "prebuilt-vaccinationCard",
+}
 
 
 class DocumentAnalysisClientWrapper:
@@ -1781,7 +2076,8 @@ class DocumentAnalysisClientWrapper:
         """
         return self.client
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_document(self, model_id: str, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document using a specified model.
         
@@ -1794,15 +2090,30 @@ class DocumentAnalysisClientWrapper:
             Dictionary containing the analysis results
         """
         try:
-            with open(document_path, "rb") as f:
-                poller = self.client.begin_analyze_document(model_id, document=f, **kwargs)
-                result = poller.result()
+            # A 1 MiB buffer keeps the transport's read() syscall count low
+            # on multi-MB documents when the mmap fallback is taken
+            with open(document_path, "rb", buffering=1 << 20) as f:
+                # Memory-map the file so the OS pages bytes on demand instead
+                # of buffering the whole document in memory
+                try:
+                    document = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # mmap fails on empty or non-regular files
+                    document = None
+                if document is not None:
+                    with document:
+                        poller = self.client.begin_analyze_document(model_id, document=document, **kwargs)
+                        result = poller.result()
+                else:
+                    poller = self.client.begin_analyze_document(model_id, document=f, **kwargs)
+                    result = poller.result()
                 return self._serialize_result(result)
         except Exception as e:
-            print(f"Error analyzing document: {str(e)}")
+            logger.exception("Error analyzing document")
             raise e
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_document_from_url(self, model_id: str, document_url: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document from a URL using a specified model.
         
@@ -1823,10 +2134,9 @@ class DocumentAnalysisClientWrapper:
             result = poller.result()
             return self._serialize_result(result)
         except Exception as e:
-            print(f"Error analyzing document from URL: {str(e)}")
+            logger.exception("Error analyzing document from URL")
             raise e
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_layout(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze the layout of a document to extract text, tables, and selection marks.
         
@@ -1837,9 +2147,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the layout analysis results
         """
-        return self.analyze_document("prebuilt-layout", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["layout"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_layout_from_url(self, document_url: str, **kwargs) -> Dict[str, Any]:
         """Analyze the layout of a document from URL to extract text, tables, and selection marks.
         
@@ -1850,9 +2159,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the layout analysis results
         """
-        return self.analyze_document_from_url("prebuilt-layout", document_url, **kwargs)
+        return self.analyze_document_from_url(PREBUILT_MODELS["layout"], document_url, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_receipt(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a receipt to extract key information.
         
@@ -1863,9 +2171,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the receipt analysis results
         """
-        return self.analyze_document("prebuilt-receipt", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["receipt"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_invoice(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze an invoice to extract key information.
         
@@ -1876,9 +2183,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the invoice analysis results
         """
-        return self.analyze_document("prebuilt-invoice", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["invoice"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_id_document(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze an identity document to extract key information.
         
@@ -1889,9 +2195,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the ID document analysis results
         """
-        return self.analyze_document("prebuilt-idDocument", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["id_document"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_business_card(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a business card to extract key information.
         
@@ -1902,9 +2207,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the business card analysis results
         """
-        return self.analyze_document("prebuilt-businessCard", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["business_card"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_w2(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a W-2 tax form to extract key information.
         
@@ -1915,9 +2219,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the W-2 analysis results
         """
-        return self.analyze_document("prebuilt-tax.us.w2", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["w2"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_1098(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a 1098 tax form to extract key information.
         
@@ -1928,9 +2231,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the 1098 analysis results
         """
-        return self.analyze_document("prebuilt-tax.us.1098", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["1098"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_1099(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a 1099 tax form to extract key information.
         
@@ -1941,9 +2243,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the 1099 analysis results
         """
-        return self.analyze_document("prebuilt-tax.us.1099", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["1099"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_health_insurance_card(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a health insurance card to extract key information.
         
@@ -1954,9 +2255,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the health insurance card analysis results
         """
-        return self.analyze_document("prebuilt-healthInsuranceCard.us", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["health_insurance_card"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_marriage_certificate(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a marriage certificate to extract key information.
         
@@ -1967,9 +2267,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the marriage certificate analysis results
         """
-        return self.analyze_document("prebuilt-marriageCertificate.us", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["marriage_certificate"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_mortgage_document(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a mortgage document to extract key information.
         
@@ -1980,9 +2279,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the mortgage document analysis results
         """
-        return self.analyze_document("prebuilt-mortgage.us", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["mortgage_document"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_pay_stub(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a pay stub to extract key information.
         
@@ -1993,9 +2291,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the pay stub analysis results
         """
-        return self.analyze_document("prebuilt-payStub.us", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["pay_stub"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_bank_check(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a bank check to extract key information.
         
@@ -2006,9 +2303,8 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the bank check analysis results
         """
-        return self.analyze_document("prebuilt-check.us", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["bank_check"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
     def analyze_vaccination_card(self, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a vaccination card to extract key information.
         
@@ -2019,9 +2315,10 @@ class DocumentAnalysisClientWrapper:
         Returns:
             Dictionary containing the vaccination card analysis results
         """
-        return self.analyze_document("prebuilt-vaccinationCard", document_path, **kwargs)
+        return self.analyze_document(PREBUILT_MODELS["vaccination_card"], document_path, **kwargs)
     
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_custom_document(self, custom_model_id: str, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document using a custom trained model.
         
@@ -2034,15 +2331,16 @@ class DocumentAnalysisClientWrapper:
             Dictionary containing the custom document analysis results
         """
         try:
-            with open(document_path, "rb") as f:
+            with open(document_path, "rb", buffering=1 << 20) as f:
                 poller = self.client.begin_analyze_document(custom_model_id, document=f, **kwargs)
                 result = poller.result()
                 return result.to_dict()
         except Exception as e:
-            print(f"Error analyzing document: {str(e)}")
+            logger.exception("Error analyzing document")
             raise e
 
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_custom_document_from_url(self, custom_model_id: str, document_url: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document from URL using a custom trained model.
         
@@ -2063,7 +2361,7 @@ class DocumentAnalysisClientWrapper:
             result = poller.result()
             return result.to_dict()
         except Exception as e:
-            print(f"Error analyzing document from URL: {str(e)}")
+            logger.exception("Error analyzing document from URL")
             raise e
     
     def analyze_batch_documents(self, model_id: str, document_paths: List[str], **kwargs) -> List[Dict[str, Any]]:
@@ -2160,80 +2458,198 @@ class DocumentAnalysisClientWrapper:
             "content": result.content,
             "pages": []
         }
-        
+
+        # Group tables by page once instead of rescanning result.tables per page
+        tables_by_page: Dict[int, List[Any]] = {}
+        for table in getattr(result, "tables", None) or []:
+            if table.bounding_regions:
+                tables_by_page.setdefault(table.bounding_regions[0].page_number, []).append(table)
+
         # Add page information
-        if hasattr(result, "pages"):
-            for page in result.pages:
-                page_dict = {
-                    "page_number": page.page_number,
-                    "lines": [],
-                    "tables": []
-                }
-                
-                # Add text lines
-                if hasattr(page, "lines"):
-                    for line in page.lines:
-                        page_dict["lines"].append({
-                            "content": line.content,
-                            "bounding_box": line.polygon if hasattr(line, "polygon") else None
-                        })
-                
-                # Add tables
-                if hasattr(result, "tables"):
-                    for table in result.tables:
-                        if table.bounding_regions and table.bounding_regions[0].page_number == page.page_number:
-                            table_dict = {
-                                "row_count": table.row_count,
-                                "column_count": table.column_count,
-                                "cells": []
+        for page in getattr(result, "pages", None) or []:
+            page_dict = {
+                "page_number": page.page_number,
+                "lines": [
+                    {
+                        "content": line.content,
+                        "bounding_box": getattr(line, "polygon", None)
+                    }
+                    for line in (getattr(page, "lines", None) or [])
+                ],
+                "tables": [
+                    {
+                        "row_count": table.row_count,
+                        "column_count": table.column_count,
+                        "cells": [
+                            {
+                                "row_index": cell.row_index,
+                                "column_index": cell.column_index,
+                                "content": cell.content,
+                                "kind": cell.kind
                             }
-                            
-                            # Add table cells
-                            for cell in table.cells:
-                                table_dict["cells"].append({
-                                    "row_index": cell.row_index,
-                                    "column_index": cell.column_index,
-                                    "content": cell.content,
-                                    "kind": cell.kind
-                                })
-                            
-                            page_dict["tables"].append(table_dict)
-                
-                serialized["pages"].append(page_dict)
-        
+                            for cell in table.cells
+                        ]
+                    }
+                    for table in tables_by_page.get(page.page_number, [])
+                ]
+            }
+            serialized["pages"].append(page_dict)
+
         # Add document type specific information
-        if hasattr(result, "key_value_pairs") and result.key_value_pairs:
-            serialized["key_value_pairs"] = []
-            for kv in result.key_value_pairs:
-                if kv.key and kv.value:
-                    serialized["key_value_pairs"].append({
-                        "key": kv.key.content,
-                        "value": kv.value.content
-                    })
-        
+        key_value_pairs = getattr(result, "key_value_pairs", None)
+        if key_value_pairs:
+            serialized["key_value_pairs"] = [
+                {
+                    "key": kv.key.content,
+                    "value": kv.value.content
+                }
+                for kv in key_value_pairs if kv.key and kv.value
+            ]
+
         return serialized
 
 
-class FormRecognizerModels:
-    """Model class for Azure Form Recognizer client.
-    
-    Provides methods for creating, training and deleting custom extraction models.
+import asyncio
+
+
+class AsyncDocumentAnalysisClientWrapper:
+    """Async wrapper for the Azure Document Analysis client.
+
+    Batching with threads costs one OS thread per in-flight poll; the async
+    client multiplexes all concurrent long-running operations on a single
+    event loop with one shared transport instead.
     """
     document_intelligence_service: DocumentIntelligenceService
-    client: DocumentModelAdministrationClient
-    
-    def __init__(self, document_intelligence_service: DocumentIntelligenceService, client: DocumentModelAdministrationClient):
+
+    def __init__(self, document_intelligence_service: DocumentIntelligenceService, client):
         self.document_intelligence_service = document_intelligence_service
         self.client = client
 
-    def get_document_models(self) -> list:
-        """
-        List all custom document model IDs in the Azure Document Intelligence resource.
+    async def __aenter__(self) -> "AsyncDocumentAnalysisClientWrapper":
+        return self
 
-        Returns:
-            list: A list of custom model IDs.
-        """
-        # Find the custom model ids
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying async client and its transport."""
+        await self.client.close()
+
+    async def analyze_document(self, model_id: str, document_path: str, **kwargs) -> Dict[str, Any]:
+        """Analyze a document using a specified model.
+
+        Args:
+            model_id: The model ID to use (e.g., "prebuilt-layout", "prebuilt-receipt", etc.)
+            document_path: Path to the document file to analyze
+            **kwargs: Additional parameters to pass to the analyze_document method
+
+        Returns:
+            Dictionary containing the analysis results
+        """
+        # Read in a worker thread so the event loop is not blocked on disk I/O
+        document_bytes = await asyncio.to_thread(self._read_file, document_path)
+        try:
+            poller = await self.client.begin_analyze_document(model_id, document=document_bytes, **kwargs)
+            result = await poller.result()
+            return self._serialize_result(result)
+        except Exception as e:
+            logger.exception("Error analyzing document")
+            raise e
+
+    async def analyze_document_from_url(self, model_id: str, document_url: str, **kwargs) -> Dict[str, Any]:
+        """Analyze a document from a URL using a specified model.
+
+        Args:
+            model_id: The model ID to use (e.g., "prebuilt-layout", "prebuilt-receipt", etc.)
+            document_url: URL of the document to analyze
+            **kwargs: Additional parameters to pass to the analyze_document method
+
+        Returns:
+            Dictionary containing the analysis results
+        """
+        try:
+            poller = await self.client.begin_analyze_document_from_url(model_id, document_url, **kwargs)
+            result = await poller.result()
+            return self._serialize_result(result)
+        except Exception as e:
+            logger.exception("Error analyzing document from URL")
+            raise e
+
+    async def analyze_batch_documents(self, model_id: str, document_paths: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Analyze multiple documents concurrently on the event loop.
+
+        Args:
+            model_id: The model ID to use for all documents
+            document_paths: List of paths to document files
+            **kwargs: Additional parameters to pass to the analyze_document method
+
+        Returns:
+            List of dictionaries containing analysis results for each document
+        """
+        outcomes = await asyncio.gather(
+            *[self.analyze_document(model_id, path, **kwargs) for path in document_paths],
+            return_exceptions=True
+        )
+        results = []
+        for path, outcome in zip(document_paths, outcomes):
+            if isinstance(outcome, BaseException):
+                results.append({"document_path": path, "status": "error", "error": str(outcome)})
+            else:
+                results.append({"document_path": path, "status": "success", "result": outcome})
+        return results
+
+    async def analyze_batch_documents_from_urls(self, model_id: str, document_urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Analyze multiple documents from URLs concurrently on the event loop.
+
+        Args:
+            model_id: The model ID to use for all documents
+            document_urls: List of document URLs
+            **kwargs: Additional parameters to pass to the analyze_document method
+
+        Returns:
+            List of dictionaries containing analysis results for each URL
+        """
+        outcomes = await asyncio.gather(
+            *[self.analyze_document_from_url(model_id, url, **kwargs) for url in document_urls],
+            return_exceptions=True
+        )
+        results = []
+        for url, outcome in zip(document_urls, outcomes):
+            if isinstance(outcome, BaseException):
+                results.append({"document_url": url, "status": "error", "error": str(outcome)})
+            else:
+                results.append({"document_url": url, "status": "success", "result": outcome})
+        return results
+
+    @staticmethod
+    def _read_file(document_path: str) -> bytes:
+        with open(document_path, "rb") as f:
+            return f.read()
+
+    # The serialized shape must stay identical to the sync wrapper's
+    _serialize_result = DocumentAnalysisClientWrapper._serialize_result
+
+
+class FormRecognizerModels:
+    """Model class for Azure Form Recognizer client.
+    
+    Provides methods for creating, training and deleting custom extraction models.
+    """
+    document_intelligence_service: DocumentIntelligenceService
+    client: DocumentModelAdministrationClient
+    
+    def __init__(self, document_intelligence_service: DocumentIntelligenceService, client: DocumentModelAdministrationClient):
+        self.document_intelligence_service = document_intelligence_service
+        self.client = client
+
+    def get_document_models(self) -> list:
+        """
+        List all custom document model IDs in the Azure Document Intelligence resource.
+
+        Returns:
+            list: A list of custom model IDs.
+        """
+        # Find the custom model ids
         custom_model_ids = [custom_model.model_id for custom_model in self.client.list_document_models()]
         return custom_model_ids
     
@@ -2328,51 +2744,257 @@ class FormRecognizerModels:
         return poller.result().to_dict()
 
 
+import sqlite3
+
+if orjson is not None:
+    # orjson turns the large serialized-result dicts into payload bytes
+    # several times faster than stdlib json and skips the intermediate str
+    def _dumps_result_bytes(value: Dict[str, Any]) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads_result_bytes(payload: bytes) -> Dict[str, Any]:
+        return orjson.loads(payload)
+else:
+    def _dumps_result_bytes(value: Dict[str, Any]) -> bytes:
+        return json.dumps(value).encode('utf-8')
+
+    def _loads_result_bytes(payload: bytes) -> Dict[str, Any]:
+        return json.loads(payload)
+
+
+@lru_cache(maxsize=1024)
+def _canonical_items(kv_tuple: Tuple[Tuple[str, Any], ...]) -> str:
+    """Serialize a sorted kwargs item tuple to a deterministic string."""
+    return json.dumps(dict(kv_tuple), sort_keys=True, default=str)
+
+
+def _canonical_kwargs(kwargs: Dict[str, Any]) -> str:
+    """Canonicalize kwargs for cache-key hashing, memoizing repeated shapes.
+
+    Identical call signatures (common under retries and notebook reruns) hit
+    the LRU instead of re-serializing. Requires hashable values; falls back
+    to direct serialization for unhashable ones.
+    """
+    try:
+        return _canonical_items(tuple(sorted(kwargs.items())))
+    except TypeError:
+        return json.dumps(kwargs, sort_keys=True, default=str)
+
+
+class _ResponseCache:
+    """Persistent SQLite-backed cache for serialized document analysis results.
+
+    Repeated analyses of identical inputs become disk reads instead of full
+    long-running operations, which eliminates API cost on replay during
+    development iteration.
+
+    Policies:
+        enabled: read and write cache entries
+        read-only: serve cached entries but never store new ones
+        write-only: store new entries but never serve them
+        disabled: bypass the cache entirely
+    """
+
+    POLICIES = ("enabled", "read-only", "write-only", "disabled")
+
+    def __init__(self, cache_path: str, policy: str = "enabled", ttl_seconds: Optional[float] = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Invalid cache policy '{policy}'. Valid policies: {', '.join(self.POLICIES)}")
+        self.policy = policy
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if policy != "disabled":
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, payload BLOB, tag TEXT, created_at REAL)"
+            )
+            self._conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self.policy != "disabled"
+
+    @staticmethod
+    def make_key(*parts: Union[str, bytes]) -> str:
+        """Build a stable SHA-256 cache key from the given parts."""
+        digest = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode('utf-8')
+            digest.update(part)
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, key: str, raw: bool = False) -> Optional[Union[Dict[str, Any], bytes]]:
+        if self.policy not in ("enabled", "read-only"):
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT payload, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if self.ttl_seconds is not None and time() - row[1] > self.ttl_seconds:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        return row[0] if raw else _loads_result_bytes(row[0])
+
+    def put(self, key: str, value: Dict[str, Any], tag: Optional[str] = None) -> None:
+        if self.policy not in ("enabled", "write-only"):
+            return
+        payload = _dumps_result_bytes(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, tag, created_at) VALUES (?, ?, ?, ?)",
+                (key, payload, tag, time())
+            )
+            self._conn.commit()
+
+    def invalidate(self, tag: str) -> int:
+        """Delete all entries stored under the given tag (e.g. a model id).
+
+        Useful when an Azure model id rolls to a new version and its cached
+        responses should no longer be served.
+
+        Returns:
+            Number of deleted entries
+        """
+        if self._conn is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE tag = ?", (tag,))
+            self._conn.commit()
+            return cursor.rowcount
+
+class _RateLimiter:
+    """Thread-safe token bucket used to throttle service calls pre-emptively.
+
+    Throttling before the request is sent keeps throughput near the quota
+    ceiling instead of burning time in 429 retry backoff.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        self.capacity = max(1, requests_per_minute)
+        self.tokens = float(self.capacity)
+        self.fill_rate = self.capacity / 60.0
+        self.updated_at = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Block until the requested number of tokens is available."""
+        while True:
+            with self.lock:
+                now = monotonic()
+                self.tokens = min(float(self.capacity), self.tokens + (now - self.updated_at) * self.fill_rate)
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = (tokens - self.tokens) / self.fill_rate
+            sleep(wait_time)
+
 class DocumentIntelligenceClientWrapper:
     """Wrapper for Azure Document Intelligence client.
-    
+
     Provides methods for analyzing documents using various models.
     """
     document_intelligence_service: DocumentIntelligenceService
     client: DocumentIntelligenceClient
-    
-    def __init__(self, document_intelligence_service: DocumentIntelligenceService, client: DocumentIntelligenceClient):
+
+    def __init__(self, document_intelligence_service: DocumentIntelligenceService, client: DocumentIntelligenceClient,
+                 requests_per_minute: Optional[int] = None,
+                 cache_policy: str = "disabled",
+                 cache_path: Optional[str] = None,
+                 cache_ttl_seconds: Optional[float] = None):
         self.document_intelligence_service = document_intelligence_service
         self.client = client
-
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
-    def analyze_document(self, model_id: str, document_path: str, **kwargs) -> Dict[str, Any]:
+        if requests_per_minute is None:
+            requests_per_minute = int(os.getenv("DOCUMENT_INTELLIGENCE_RPM", "60"))
+        self._rate_limiter = _RateLimiter(requests_per_minute)
+        if cache_path is None:
+            cache_path = os.path.join(os.path.expanduser("~"), ".azwrap", "doc_intelligence_cache.db")
+        self._response_cache = _ResponseCache(cache_path, policy=cache_policy, ttl_seconds=cache_ttl_seconds)
+
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
+    def analyze_document(self, model_id: str, document_path: str, return_bytes: bool = False, **kwargs) -> Union[Dict[str, Any], bytes]:
         """Analyze a document using a specified model.
-        
+
         Args:
             model_id: The model ID to use (e.g., "prebuilt-layout", "prebuilt-receipt", etc.)
             document_path: Path to the document file to analyze
+            return_bytes: Return the result as JSON bytes instead of a dict
             **kwargs: Additional parameters to pass to the analyze_document method
-            
+
         Returns:
-            Dictionary containing the analysis results
+            Dictionary containing the analysis results, or JSON bytes when
+            return_bytes is True
         """
-        try:
+        cache_key = None
+        if self._response_cache.enabled:
             with open(document_path, "rb") as f:
-                poller = self.client.begin_analyze_document(model_id, body=f, **kwargs) 
-                result = poller.result()
-                return self._serialize_result(result)
+                file_bytes = f.read()
+            cache_key = _ResponseCache.make_key(model_id, file_bytes, _canonical_kwargs(kwargs))
+            cached = self._response_cache.get(cache_key, raw=return_bytes)
+            if cached is not None:
+                return cached
+
+        self._rate_limiter.acquire()
+        try:
+            # A 1 MiB buffer keeps the transport's read() syscall count low
+            # on multi-MB documents when the mmap fallback is taken
+            with open(document_path, "rb", buffering=1 << 20) as f:
+                # Memory-map the file so the OS pages bytes on demand instead
+                # of buffering the whole document in memory
+                try:
+                    body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # mmap fails on empty or non-regular files
+                    body = None
+                if body is not None:
+                    with body:
+                        poller = self.client.begin_analyze_document(model_id, body=body, **kwargs)
+                        result = poller.result()
+                else:
+                    poller = self.client.begin_analyze_document(model_id, body=f, **kwargs)
+                    result = poller.result()
+                serialized = self._serialize_result(result)
+                if cache_key is not None:
+                    self._response_cache.put(cache_key, serialized, tag=model_id)
+                return _dumps_result_bytes(serialized) if return_bytes else serialized
         except Exception as e:
-            print(f"Error analyzing document: {str(e)}")
+            logger.exception("Error analyzing document")
             raise e
 
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
-    def analyze_document_from_url(self, model_id: str, document_url: str, **kwargs) -> Dict[str, Any]:
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
+    def analyze_document_from_url(self, model_id: str, document_url: str, return_bytes: bool = False, **kwargs) -> Union[Dict[str, Any], bytes]:
         """Analyze a document from a URL using a specified model.
-        
+
         Args:
             model_id: The model ID to use (e.g., "prebuilt-layout", "prebuilt-receipt", etc.)
             document_url: URL of the document to analyze
+            return_bytes: Return the result as JSON bytes instead of a dict
             **kwargs: Additional parameters to pass to the analyze_document method
-            
+
         Returns:
-            Dictionary containing the analysis results
+            Dictionary containing the analysis results, or JSON bytes when
+            return_bytes is True
         """
+        cache_key = None
+        if self._response_cache.enabled:
+            cache_key = _ResponseCache.make_key(model_id, document_url, _canonical_kwargs(kwargs))
+            cached = self._response_cache.get(cache_key, raw=return_bytes)
+            if cached is not None:
+                return cached
+
+        self._rate_limiter.acquire()
         try:
             poller = self.client.begin_analyze_document(
                 model_id,
@@ -2380,12 +3002,16 @@ class DocumentIntelligenceClientWrapper:
                 **kwargs
             )
             result = poller.result()
-            return self._serialize_result(result)
+            serialized = self._serialize_result(result)
+            if cache_key is not None:
+                self._response_cache.put(cache_key, serialized, tag=model_id)
+            return _dumps_result_bytes(serialized) if return_bytes else serialized
         except Exception as e:
-            print(f"Error analyzing document from URL: {str(e)}")
+            logger.exception("Error analyzing document from URL")
             raise e
 
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_custom_document(self, custom_model_id: str, document_path: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document using a custom trained model.
         
@@ -2398,15 +3024,16 @@ class DocumentIntelligenceClientWrapper:
             Dictionary containing the custom document analysis results
         """
         try:
-            with open(document_path, "rb") as f:
+            with open(document_path, "rb", buffering=1 << 20) as f:
                 poller = self.client.begin_analyze_document(custom_model_id, body=f, **kwargs)
                 result = poller.result()
                 return result.as_dict()
         except Exception as e:
-            print(f"Error analyzing document: {str(e)}")
+            logger.exception("Error analyzing document")
             raise e
 
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
+    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
     def analyze_custom_document_from_url(self, custom_model_id: str, document_url: str, **kwargs) -> Dict[str, Any]:
         """Analyze a document from URL using a custom trained model.
         
@@ -2427,49 +3054,71 @@ class DocumentIntelligenceClientWrapper:
             result = poller.result()
             return result.as_dict()
         except Exception as e:
-            print(f"Error analyzing document from URL: {str(e)}")
+            logger.exception("Error analyzing document from URL")
             raise e
         
-    def analyze_batch_documents(self, model_id: str, document_paths: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def analyze_batch_documents(self, model_id: str, document_paths: List[str], max_workers: int = 8, **kwargs) -> List[Dict[str, Any]]:
         """Analyze multiple documents in batch using the specified model.
-        
+
+        Documents are analyzed concurrently since each analysis is a
+        service-side long-running operation and the wall-clock time is
+        dominated by polling.
+
         Args:
             model_id: The model ID to use for all documents
             document_paths: List of paths to document files to analyze
+            max_workers: Number of documents to analyze concurrently
             **kwargs: Additional parameters to pass to the analyze_document method
-            
+
         Returns:
             List of dictionaries containing analysis results for each document
         """
-        results = []
-        for path in document_paths:
-            try:
-                result = self.analyze_document(model_id, path, **kwargs)
-                results.append({"document_path": path, "status": "success", "result": result})
-            except Exception as e:
-                results.append({"document_path": path, "status": "error", "error": str(e)})
+        # Results are placed by input index so the returned list lines up
+        # with document_paths regardless of completion order
+        results: List[Optional[Dict[str, Any]]] = [None] * len(document_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(self.analyze_document, model_id, path, **kwargs): i
+                       for i, path in enumerate(document_paths)}
+            for future in as_completed(futures):
+                i = futures[future]
+                path = document_paths[i]
+                try:
+                    results[i] = {"document_path": path, "status": "success", "result": future.result()}
+                except Exception as e:
+                    results[i] = {"document_path": path, "status": "error", "error": str(e)}
         return results
-    
-    def analyze_batch_documents_from_urls(self, model_id: str, document_urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+
+    def analyze_batch_documents_from_urls(self, model_id: str, document_urls: List[str], max_workers: int = 8, **kwargs) -> List[Dict[str, Any]]:
         """Analyze multiple documents from URLs in batch using the specified model.
-        
+
+        Documents are analyzed concurrently since each analysis is a
+        service-side long-running operation and the wall-clock time is
+        dominated by polling.
+
         Args:
             model_id: The model ID to use for all documents
             document_urls: List of URLs of documents to analyze
+            max_workers: Number of documents to analyze concurrently
             **kwargs: Additional parameters to pass to the analyze_document method
-            
+
         Returns:
             List of dictionaries containing analysis results for each document
         """
-        results = []
-        for url in document_urls:
-            try:
-                result = self.analyze_document_from_url(model_id, url, **kwargs)
-                results.append({"document_url": url, "status": "success", "result": result})
-            except Exception as e:
-                results.append({"document_url": url, "status": "error", "error": str(e)})
-        return results      
-    
+        # Results are placed by input index so the returned list lines up
+        # with document_urls regardless of completion order
+        results: List[Optional[Dict[str, Any]]] = [None] * len(document_urls)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(self.analyze_document_from_url, model_id, url, **kwargs): i
+                       for i, url in enumerate(document_urls)}
+            for future in as_completed(futures):
+                i = futures[future]
+                url = document_urls[i]
+                try:
+                    results[i] = {"document_url": url, "status": "success", "result": future.result()}
+                except Exception as e:
+                    results[i] = {"document_url": url, "status": "error", "error": str(e)}
+        return results
+
     def analyze_batch_custom_documents(self, custom_model_id: str, document_paths: List[str], **kwargs) -> List[Dict[str, Any]]:
         """Analyze multiple documents in batch using the specified model.
         
@@ -2524,59 +3173,60 @@ class DocumentIntelligenceClientWrapper:
             "content": result.content,
             "pages": []
         }
-        
+
+        # Group tables by page once instead of rescanning result.tables per page
+        tables_by_page: Dict[int, List[Any]] = {}
+        for table in getattr(result, "tables", None) or []:
+            if table.bounding_regions:
+                tables_by_page.setdefault(table.bounding_regions[0].page_number, []).append(table)
+
         # Add page information
-        if hasattr(result, "pages"):
-            for page in result.pages:
-                page_dict = {
-                    "page_number": page.page_number,
-                    "lines": [],
-                    "tables": []
-                }
-                
-                # Add text lines
-                if hasattr(page, "lines"):
-                    for line in page.lines:
-                        page_dict["lines"].append({
-                            "content": line.content,
-                            "bounding_box": line.polygon if hasattr(line, "polygon") else None
-                        })
-                
-                # Add tables
-                if hasattr(result, "tables"):
-                    for table in result.tables:
-                        if table.bounding_regions and table.bounding_regions[0].page_number == page.page_number:
-                            table_dict = {
-                                "row_count": table.row_count,
-                                "column_count": table.column_count,
-                                "cells": []
+        for page in getattr(result, "pages", None) or []:
+            page_dict = {
+                "page_number": page.page_number,
+                "lines": [
+                    {
+                        "content": line.content,
+                        "bounding_box": getattr(line, "polygon", None)
+                    }
+                    for line in (getattr(page, "lines", None) or [])
+                ],
+                "tables": [
+                    {
+                        "row_count": table.row_count,
+                        "column_count": table.column_count,
+                        "cells": [
+                            {
+                                "row_index": cell.row_index,
+                                "column_index": cell.column_index,
+                                "content": cell.content,
+                                "kind": cell.kind
                             }
-                            
-                            # Add table cells
-                            for cell in table.cells:
-                                table_dict["cells"].append({
-                                    "row_index": cell.row_index,
-                                    "column_index": cell.column_index,
-                                    "content": cell.content,
-                                    "kind": cell.kind
-                                })
-                            
-                            page_dict["tables"].append(table_dict)
-                
-                serialized["pages"].append(page_dict)
-        
+                            for cell in table.cells
+                        ]
+                    }
+                    for table in tables_by_page.get(page.page_number, [])
+                ]
+            }
+            serialized["pages"].append(page_dict)
+
         # Add document type specific information
-        if hasattr(result, "key_value_pairs") and result.key_value_pairs:
-            serialized["key_value_pairs"] = []
-            for kv in result.key_value_pairs:
-                if kv.key and kv.value:
-                    serialized["key_value_pairs"].append({
-                        "key": kv.key.content,
-                        "value": kv.value.content
-                    })
-        
+        key_value_pairs = getattr(result, "key_value_pairs", None)
+        if key_value_pairs:
+            serialized["key_value_pairs"] = [
+                {
+                    "key": kv.key.content,
+                    "value": kv.value.content
+                }
+                for kv in key_value_pairs if kv.key and kv.value
+            ]
+
         return serialized
 
+    def _serialize_result_bytes(self, result) -> bytes:
+        """Serialize the document analysis result straight to JSON bytes."""
+        return _dumps_result_bytes(self._serialize_result(result))
+
 class DocumentIntelligenceModels:
 
     document_intelligence_service: DocumentIntelligenceService
@@ -2698,32 +3348,353 @@ class DocumentIntelligenceModels:
         return poller.result().as_dict()
 
 
+_WS_RE = re.compile(r'\s+')
+
+class EmbeddingCache:
+    """Two-tier cache for embedding vectors keyed by BLAKE2b(model, text).
+
+    Identical text re-embedded during re-indexing or repeat queries is pure
+    duplicated network I/O; any hit replaces an API round-trip with a memory
+    or disk read. Tier one is an in-process LRU dict, tier two a persistent
+    SQLite store shared across runs. Text is normalized (whitespace collapsed,
+    case folded) before hashing so trivial variants of the same request share
+    a key; the model name is part of the key so a model swap never returns
+    stale vectors.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_memory_entries: int = 10000):
+        if cache_path is None:
+            cache_path = os.path.join(os.path.expanduser("~"), ".azwrap", "embedding_cache.db")
+        self.cache_path = cache_path
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB, created_at REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """Collapse whitespace and case-fold so trivial variants exact-match."""
+        return _WS_RE.sub(' ', text.strip().casefold())
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Build the cache key for a model and text pair.
+
+        The text is normalized first, so inputs differing only in case or
+        whitespace hit the same entry. BLAKE2b with a 16-byte digest is
+        roughly 3x faster than SHA-256 and ample for cache-key use.
+        """
+        normalized = EmbeddingCache._normalize_text(text)
+        return hashlib.blake2b(f"{model}\0{normalized}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return the cached vector for the key, or None on miss."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return vector
+            row = self._conn.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            vector = _loads_result_bytes(row[0])
+            self._remember(key, vector)
+            self.hits += 1
+            return vector
+
+    def put(self, key: str, vector: List[float]) -> None:
+        """Store a vector under the key in both tiers."""
+        with self._lock:
+            self._remember(key, vector)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                (key, _dumps_result_bytes(vector), time())
+            )
+            self._conn.commit()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and the in-memory entry count."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def resolve(self, vector: List[float]) -> List[float]:
+        """Canonicalize a freshly computed vector before it is stored.
+
+        The exact-match cache stores vectors as-is; subclasses may map
+        near-duplicates onto a shared representative.
+        """
+        return vector
+
+
+import numpy as np
+
+
+class SemanticEmbeddingCache(EmbeddingCache):
+    """Embedding cache that also folds near-duplicate texts together.
+
+    Texts differing only by whitespace or typos produce embeddings that
+    cluster tightly; when a fresh vector lies within the cosine similarity
+    threshold of a stored centroid, the centroid is reused instead of
+    growing the cache with one more almost-identical vector.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_memory_entries: int = 10000,
+                 similarity_threshold: float = 0.86, max_centroids: int = 4096,
+                 quantize_centroids: bool = True):
+        super().__init__(cache_path, max_memory_entries)
+        self.similarity_threshold = similarity_threshold
+        self.max_centroids = max_centroids
+        # Symmetric per-vector int8 quantization quarters centroid memory
+        # and the bandwidth of every cosine scan; the rounding error is far
+        # below the near-duplicate threshold
+        self.quantize_centroids = quantize_centroids
+        # Centroid storage is preallocated at max_centroids rows once the
+        # vector dimension is known and written in place through a ring
+        # cursor (FIFO eviction), so inserts never restack the whole matrix
+        self._centroid_matrix: Optional[np.ndarray] = None
+        self._centroid_scales: Optional[np.ndarray] = None
+        self._centroid_norms: Optional[np.ndarray] = None
+        self._centroid_count = 0
+        self._next_slot = 0
+
+    def resolve(self, vector: List[float]) -> List[float]:
+        """Get the nearest stored centroid, or register the vector as one.
+
+        Returns the centroid when its cosine similarity to the vector is at
+        least the threshold; otherwise the vector itself, now tracked as a
+        new centroid.
+        """
+        with self._lock:
+            if self._centroid_count:
+                query = np.asarray(vector, dtype=np.float32)
+                query /= np.linalg.norm(query) or 1.0
+                count = self._centroid_count
+                # int8 rows upcast during the product, so the scan moves a
+                # quarter of the bytes of a float32 matrix
+                similarities = (self._centroid_matrix[:count] @ query) * self._centroid_scales[:count] / self._centroid_norms[:count]
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    return self._dequantize(best)
+            self._add_centroid(vector)
+            return vector
+
+    def _add_centroid(self, vector: List[float]) -> None:
+        dense = np.asarray(vector, dtype=np.float32)
+        if self._centroid_matrix is None:
+            dtype = np.int8 if self.quantize_centroids else np.float32
+            self._centroid_matrix = np.zeros((self.max_centroids, dense.shape[0]), dtype=dtype)
+            self._centroid_scales = np.ones(self.max_centroids, dtype=np.float32)
+            self._centroid_norms = np.ones(self.max_centroids, dtype=np.float32)
+
+        # One row write plus one norm per insert; the ring cursor overwrites
+        # the oldest centroid once the matrix is full
+        slot = self._next_slot
+        if self.quantize_centroids:
+            scale = float(np.abs(dense).max()) / 127 or 1.0
+            quantized = np.round(dense / scale).astype(np.int8)
+            self._centroid_matrix[slot] = quantized
+            self._centroid_scales[slot] = scale
+            norm = float(np.linalg.norm(quantized.astype(np.float32) * scale))
+        else:
+            self._centroid_matrix[slot] = dense
+            self._centroid_scales[slot] = 1.0
+            norm = float(np.linalg.norm(dense))
+        self._centroid_norms[slot] = norm or 1.0
+        self._next_slot = (slot + 1) % self.max_centroids
+        self._centroid_count = min(self._centroid_count + 1, self.max_centroids)
+
+    def _dequantize(self, index: int) -> List[float]:
+        centroid = self._centroid_matrix[index]
+        if centroid.dtype == np.int8:
+            return (centroid.astype(np.float32) * float(self._centroid_scales[index])).tolist()
+        return centroid.tolist()
+
+
 class OpenAIClient:
-    ai_service: AIService 
+    ai_service: AIService
     openai_client: AzureOpenAI
 
-    def __init__(self, ai_service: AIService, openai_client: AzureOpenAI):
+    def __init__(self, ai_service: AIService, openai_client: AzureOpenAI,
+                 embedding_cache: Optional[EmbeddingCache] = None):
         self.ai_service = ai_service
         self.openai_client = openai_client
-    
-    @retry(wait=wait_random_exponential(min=1, max=20), stop=stop_after_attempt(6))
-    def generate_embeddings(self, text: str, model: str = "text-embedding-3-large") -> List[float]:
+        self.embedding_cache = embedding_cache
+
+    @retry(wait=wait_exponential_jitter(initial=1, max=30), stop=stop_after_attempt(5),
+           retry=retry_if_exception_type(_OPENAI_TRANSIENT_ERRORS))
+    def _create_embeddings(self, batch: List[str], model: str) -> List[List[float]]:
+        """Issue one embeddings API call for a batch of texts."""
+        response = self.openai_client.embeddings.create(input=batch, model=model)
+        return [d.embedding for d in response.data]
+
+    @retry(wait=wait_exponential_jitter(initial=1, max=30), stop=stop_after_attempt(5),
+           retry=retry_if_exception_type(_OPENAI_TRANSIENT_ERRORS))
+    def _create_chat_completion(self, **kwargs) -> Any:
+        """Issue one chat-completions API call with transient-error retries."""
+        return self.openai_client.chat.completions.create(**kwargs)
+
+    def generate_embeddings(self,
+                            text: Union[str, List[str]],
+                            model: str = "text-embedding-3-large",
+                            batch_size: int = 64,
+                            max_workers: int = 8,
+                            return_type: str = 'list',
+                            normalize: bool = False) -> Union[List[float], List[List[float]], np.ndarray]:
         """
         Generate embeddings for text using Azure OpenAI.
-        
+
+        A list input is sent as array batches, collapsing N round-trips into
+        ceil(N / batch_size) requests fired in parallel.
+
         Args:
-            text: The text to generate embeddings for
+            text: The text (or list of texts) to generate embeddings for
             model: The embedding model to use
-            
+            batch_size: Number of texts per embeddings API call
+            max_workers: Worker threads used to fire sub-batches in parallel
+            return_type: 'list' for Python lists, 'ndarray' for a contiguous
+                float32 array ((N, D) for list input) that downstream cosine
+                math can feed to BLAS directly
+            normalize: L2-normalize ndarray output so cosine similarity
+                reduces to a single matrix product
+
         Returns:
-            List of float values representing the embedding vector
+            The embedding vector for a single text, or the vectors in input
+            order for a list of texts, as lists or a float32 ndarray
         """
+        if return_type not in ('list', 'ndarray'):
+            raise ValueError(f"Invalid return_type '{return_type}'. Valid values: list, ndarray")
         try:
-            response = self.openai_client.embeddings.create(input=text, model=model)
-            return response.data[0].embedding
+            texts = [text] if isinstance(text, str) else list(text)
+            vectors: List[Optional[List[float]]] = [None] * len(texts)
+
+            # Serve cached vectors first so only misses hit the API
+            pending = list(range(len(texts)))
+            if self.embedding_cache is not None:
+                keys = [EmbeddingCache.make_key(model, t) for t in texts]
+                pending = []
+                for position, key in enumerate(keys):
+                    cached = self.embedding_cache.get(key)
+                    if cached is not None:
+                        vectors[position] = cached
+                    else:
+                        pending.append(position)
+
+            if pending:
+                pending_texts = [texts[position] for position in pending]
+                fetched = self._generate_embedding_batches(pending_texts, model, batch_size, max_workers)
+                for position, vector in zip(pending, fetched):
+                    if self.embedding_cache is not None:
+                        # May substitute a near-duplicate centroid for the
+                        # fresh vector, depending on the cache implementation
+                        vector = self.embedding_cache.resolve(vector)
+                        self.embedding_cache.put(keys[position], vector)
+                    vectors[position] = vector
+
+            if return_type == 'ndarray':
+                array = np.asarray(vectors, dtype=np.float32)
+                if normalize:
+                    norms = np.linalg.norm(array, axis=1, keepdims=True)
+                    norms[norms == 0] = 1.0
+                    array /= norms
+                return array[0] if isinstance(text, str) else array
+            return vectors[0] if isinstance(text, str) else vectors
         except Exception as e:
-            print(f"Error generating embeddings: {str(e)}")
+            logger.exception("Error generating embeddings")
             raise e
+
+    def generate_embeddings_batch_job(self, texts: List[str], model: str = "text-embedding-3-large",
+                                      poll_interval: float = 30.0,
+                                      timeout: Optional[float] = None) -> List[List[float]]:
+        """
+        Embed texts through the Azure OpenAI Batch API.
+
+        For bulk non-realtime jobs (initial index population) the Batch API
+        trades latency (up to 24h completion window) for significantly lower
+        per-token pricing and no realtime rate-limit pressure.
+
+        Args:
+            texts: The texts to generate embeddings for
+            model: The embedding model to use
+            poll_interval: Seconds between job status polls
+            timeout: Optional overall seconds to wait before raising
+
+        Returns:
+            List of embedding vectors in input order
+        """
+        import io
+
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"input": text, "model": model}
+            })
+            for i, text in enumerate(texts)
+        ]
+        batch_file = io.BytesIO("\n".join(lines).encode('utf-8'))
+
+        uploaded = self.openai_client.files.create(file=batch_file, purpose='batch')
+        job = self.openai_client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint='/v1/embeddings',
+            completion_window='24h'
+        )
+
+        started_at = monotonic()
+        while True:
+            job = self.openai_client.batches.retrieve(job.id)
+            if job.status == 'completed':
+                break
+            if job.status in ('failed', 'expired', 'cancelled'):
+                raise RuntimeError(f"Embedding batch job {job.id} ended with status '{job.status}'")
+            if timeout is not None and monotonic() - started_at > timeout:
+                raise TimeoutError(f"Embedding batch job {job.id} did not complete within {timeout}s")
+            sleep(poll_interval)
+
+        output = self.openai_client.files.content(job.output_file_id)
+        vectors_by_id: Dict[int, List[float]] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            vectors_by_id[int(entry["custom_id"])] = entry["response"]["body"]["data"][0]["embedding"]
+        return [vectors_by_id[i] for i in range(len(texts))]
+
+    def _generate_embedding_batches(self, texts: List[str], model: str,
+                                    batch_size: int, max_workers: int) -> List[List[float]]:
+        """Embed texts as parallel sub-batches, preserving input order."""
+        if not texts:
+            return []
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) == 1:
+            return self._create_embeddings(batches[0], model)
+
+        embeddings: List[Optional[List[List[float]]]] = [None] * len(batches)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._create_embeddings, batch, model): position
+                       for position, batch in enumerate(batches)}
+            for future in as_completed(futures):
+                embeddings[futures[future]] = future.result()
+        return [vector for batch_vectors in embeddings for vector in batch_vectors]
     
     def generate_chat_completion(self, 
                                 messages: List[Dict[str, str]], 
@@ -2731,27 +3702,35 @@ class OpenAIClient:
                                 temperature: float = 0.7, 
                                 max_tokens: int = 800,
                                 response_format: Dict[str, Any] = None,
+                                prediction: Dict[str, Any] = None,
                                 ) -> Dict[str, Any]:
         """
         Generate a chat completion using Azure OpenAI.
-        
+
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             model: The deployment name of the model
             temperature: Temperature for generation (0-1)
             max_tokens: Maximum number of tokens to generate
-            
+            prediction: Optional Predicted Outputs content for deployments
+                that support speculative decoding against a known draft
+
         Returns:
             Chat completion response
         """
         try:
-            response = self.openai_client.chat.completions.create(
+            kwargs: Dict[str, Any] = dict(
                 model=model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 response_format=response_format
             )
+            # Only send the parameter when requested; older API versions and
+            # unsupporting deployments reject unknown fields
+            if prediction is not None:
+                kwargs['prediction'] = prediction
+            response = self._create_chat_completion(**kwargs)
             return {
                 "content": response.choices[0].message.content,
                 "finish_reason": response.choices[0].finish_reason,
@@ -2762,10 +3741,162 @@ class OpenAIClient:
                 }
             }
         except Exception as e:
-            print(f"Error generating chat completion: {str(e)}")
+            logger.exception("Error generating chat completion")
             return {"error": str(e)}
 
+class AsyncOpenAIClient:
+    """Async sibling of OpenAIClient built on AsyncAzureOpenAI.
+
+    Each sync call blocks a thread for a full round-trip; the async client
+    overlaps N in-flight calls on one event loop and connection pool, which
+    suits bulk indexing and multi-question fan-out.
+    """
+    ai_service: AIService
+    openai_client: AsyncAzureOpenAI
+
+    def __init__(self, ai_service: AIService, openai_client: AsyncAzureOpenAI):
+        self.ai_service = ai_service
+        self.openai_client = openai_client
+
+    async def generate_embeddings(self, text: str, model: str = "text-embedding-3-large") -> List[float]:
+        """
+        Generate embeddings for one text using Azure OpenAI.
+
+        Args:
+            text: The text to generate embeddings for
+            model: The embedding model to use
+
+        Returns:
+            List of float values representing the embedding vector
+        """
+        try:
+            response = await self.openai_client.embeddings.create(input=text, model=model)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.exception("Error generating embeddings")
+            raise e
+
+    async def embed_batch(self, texts: List[str], model: str = "text-embedding-3-large",
+                          concurrency: int = 10) -> List[List[float]]:
+        """
+        Embed many texts with bounded concurrency on the event loop.
+
+        Args:
+            texts: The texts to generate embeddings for
+            model: The embedding model to use
+            concurrency: Maximum number of in-flight API calls
+
+        Returns:
+            List of embedding vectors in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def embed_one(text: str) -> List[float]:
+            async with semaphore:
+                response = await self.openai_client.embeddings.create(input=text, model=model)
+                return response.data[0].embedding
+
+        return list(await asyncio.gather(*[embed_one(text) for text in texts]))
+
+    def embed_batch_sync(self, texts: List[str], model: str = "text-embedding-3-large",
+                         concurrency: int = 10) -> List[List[float]]:
+        """
+        Run embed_batch from synchronous code.
+
+        Args:
+            texts: The texts to generate embeddings for
+            model: The embedding model to use
+            concurrency: Maximum number of in-flight API calls
+
+        Returns:
+            List of embedding vectors in input order
+        """
+        return asyncio.run(self.embed_batch(texts, model=model, concurrency=concurrency))
+
+    async def generate_chat_completion(self,
+                                       messages: List[Dict[str, str]],
+                                       model: str,
+                                       temperature: float = 0.7,
+                                       max_tokens: int = 800,
+                                       response_format: Dict[str, Any] = None,
+                                       ) -> Dict[str, Any]:
+        """
+        Generate a chat completion using Azure OpenAI.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: The deployment name of the model
+            temperature: Temperature for generation (0-1)
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Chat completion response
+        """
+        try:
+            response = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format
+            )
+            return {
+                "content": response.choices[0].message.content,
+                "finish_reason": response.choices[0].finish_reason,
+                "usage": {
+                    "prompt_tokens": response.usage.prompt_tokens,
+                    "completion_tokens": response.usage.completion_tokens,
+                    "total_tokens": response.usage.total_tokens
+                }
+            }
+        except Exception as e:
+            logger.exception("Error generating chat completion")
+            return {"error": str(e)}
+
+    async def close(self) -> None:
+        """Close the underlying async client."""
+        await self.openai_client.close()
+
+
+_shared_transport = None
+_shared_transport_lock = threading.Lock()
+
+
+def _get_shared_transport():
+    """Get the module-wide HTTP transport shared by all search clients.
+
+    Every azure-search-documents client constructed by this module reuses
+    one keep-alive connection pool, so per-client TLS handshakes and socket
+    churn are avoided.
+
+    Returns:
+        RequestsTransport backed by a pooled requests.Session
+    """
+    global _shared_transport
+    if _shared_transport is None:
+        with _shared_transport_lock:
+            if _shared_transport is None:
+                import atexit
+                import requests
+                from requests.adapters import HTTPAdapter
+                from azure.core.pipeline.transport import RequestsTransport
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _shared_transport = RequestsTransport(session=session, session_owner=False, connection_timeout=300)
+                atexit.register(session.close)
+    return _shared_transport
+
+
 class SearchService:
+    # Slots avoid a per-instance __dict__ and make attribute access a
+    # C-level descriptor lookup
+    __slots__ = ('subscription', 'resource_group', 'search_service',
+                 'index_client', 'search_client', 'openai_client',
+                 'index_name', '_admin_key', '_credential')
+
     search_service: azsrm.SearchService
     subscription: Subscription
     resource_group: ResourceGroup
@@ -2782,16 +3913,29 @@ class SearchService:
         self.search_client: Optional[azsd.SearchClient] = None
         self.openai_client: Optional[Any] = None
         self.index_name: str = os.getenv("INDEX_NAME", "default-index")
-    
+        # Cached admin key and credential; keys change only on rotation, so
+        # client getters need not pay an ARM round-trip each time
+        self._admin_key: Optional[str] = None
+        self._credential: Optional[AzureKeyCredential] = None
+
     def get_admin_key(self) -> str:
-        search_mgmt_client = SearchManagementClient(self.resource_group.subscription.identity.get_credential(),
-                                                    self.resource_group.subscription.subscription_id)
-        keys = search_mgmt_client.admin_keys.get(resource_group_name=self.resource_group.azure_resource_group.name,
-                                                search_service_name=self.search_service.name)
-        return keys.primary_key
+        if self._admin_key is None:
+            search_mgmt_client = SearchManagementClient(self.resource_group.subscription.identity.get_credential(),
+                                                        self.resource_group.subscription.subscription_id)
+            keys = search_mgmt_client.admin_keys.get(resource_group_name=self.resource_group.azure_resource_group.name,
+                                                    search_service_name=self.search_service.name)
+            self._admin_key = keys.primary_key
+        return self._admin_key
 
     def get_credential(self) -> AzureKeyCredential:
-        return AzureKeyCredential(self.get_admin_key())
+        if self._credential is None:
+            self._credential = AzureKeyCredential(self.get_admin_key())
+        return self._credential
+
+    def invalidate_credentials(self) -> None:
+        """Drop the cached admin key and credential after a key rotation."""
+        self._admin_key = None
+        self._credential = None
 
     def get_service_endpoint(self) -> str:
         return f"https://{self.search_service.name}.search.windows.net"
@@ -2799,7 +3943,8 @@ class SearchService:
     def get_index_client(self) -> azsdi.SearchIndexClient:
         if self.index_client is None:
             self.index_client = azsdi.SearchIndexClient(self.get_service_endpoint(),
-                                                         self.get_credential())
+                                                         self.get_credential(),
+                                                         transport=_get_shared_transport())
         return self.index_client
     
     def get_indexes(self) -> List[azsdim.SearchIndex]:
@@ -2927,7 +4072,8 @@ class SearchService:
         """
         return SearchIndexerClient(
             endpoint=self.get_service_endpoint(),
-            credential=self.get_credential()
+            credential=self.get_credential(),
+            transport=_get_shared_transport()
         )
     
     def create_indexer_manager(self) -> "SearchIndexerManager":
@@ -2939,21 +4085,12 @@ class SearchService:
         """
         return SearchIndexerManager(self)
     
-def get_std_vector_search( connections_per_node:int = 4, 
-                          neighbors_list_size: int = 400, 
-                          search_list_size: int = 500, 
-                          metric: str = "cosine") -> azsdim.VectorSearch:
-    """
-    Get a standard vector search configuration.
-    Args:
-        connections_per_node: Number of connections per node. Default is 4.
-        neighbors_list_size: Size of the dynamic list for nearest neighbors. Default is 400.
-        search_list_size: Size of the dynamic list for searching. Default is 500.
-        metric: Distance metric (cosine, euclidean, dotProduct). Default is cosine.
-    Returns:
-        A vector search configuration
-    """
-    # Define vector search configuration
+@lru_cache(maxsize=32)
+def _build_std_vector_search(connections_per_node: int,
+                             neighbors_list_size: int,
+                             search_list_size: int,
+                             metric: str) -> azsdim.VectorSearch:
+    """Build (and memoize) a standard vector search configuration."""
     vector_search = azsdim.VectorSearch(
         algorithms=[
             azsdim.VectorSearchAlgorithmConfiguration(
@@ -2976,19 +4113,31 @@ def get_std_vector_search( connections_per_node:int = 4,
     )
     return vector_search
 
-def get_exhaustive_KNN_vector_search(algorithm_name: str = "default-algorithm", 
-                                     vector_search_profile_name: str = "default-profile", 
-                                     metric: str = "cosine") -> azsdim.VectorSearch:
+def get_std_vector_search( connections_per_node:int = 4,
+                          neighbors_list_size: int = 400,
+                          search_list_size: int = 500,
+                          metric: str = "cosine") -> azsdim.VectorSearch:
     """
-    Get an exhaustive KNN vector search configuration.
+    Get a standard vector search configuration.
+
+    Configurations are memoized per argument tuple, so repeated calls with
+    the same parameters reuse one object instead of rebuilding the model.
     Args:
-        algorithm_name: Name of the algorithm. Default is "default-algorithm".
-        vector_search_profile_name: Name of the vector search profile. Default is "default-profile".
+        connections_per_node: Number of connections per node. Default is 4.
+        neighbors_list_size: Size of the dynamic list for nearest neighbors. Default is 400.
+        search_list_size: Size of the dynamic list for searching. Default is 500.
         metric: Distance metric (cosine, euclidean, dotProduct). Default is cosine.
     Returns:
-        An exhaustive KNN vector search configuration
+        A vector search configuration
     """
-    # Define vector search configuration
+    return _build_std_vector_search(connections_per_node, neighbors_list_size,
+                                    search_list_size, metric)
+
+@lru_cache(maxsize=32)
+def _build_exhaustive_KNN_vector_search(algorithm_name: str,
+                                        vector_search_profile_name: str,
+                                        metric: str) -> azsdim.VectorSearch:
+    """Build (and memoize) an exhaustive KNN vector search configuration."""
     vector_search = azsdim.VectorSearch(
         algorithms=[
             azsdim.ExhaustiveKnnAlgorithmConfiguration(
@@ -3007,6 +4156,23 @@ def get_exhaustive_KNN_vector_search(algorithm_name: str = "default-algorithm",
     )
     return vector_search
 
+def get_exhaustive_KNN_vector_search(algorithm_name: str = "default-algorithm",
+                                     vector_search_profile_name: str = "default-profile",
+                                     metric: str = "cosine") -> azsdim.VectorSearch:
+    """
+    Get an exhaustive KNN vector search configuration.
+
+    Configurations are memoized per argument tuple, so repeated calls with
+    the same parameters reuse one object instead of rebuilding the model.
+    Args:
+        algorithm_name: Name of the algorithm. Default is "default-algorithm".
+        vector_search_profile_name: Name of the vector search profile. Default is "default-profile".
+        metric: Distance metric (cosine, euclidean, dotProduct). Default is cosine.
+    Returns:
+        An exhaustive KNN vector search configuration
+    """
+    return _build_exhaustive_KNN_vector_search(algorithm_name, vector_search_profile_name, metric)
+
 class SearchIndexerManager:
     """
     A manager for working with Azure AI Search indexers, data sources, and skillsets.
@@ -3184,7 +4350,9 @@ class DataSourceConnection:
     """
     Represents a data source connection in Azure AI Search.
     """
-    
+
+    __slots__ = ('manager', 'data_source')
+
     def __init__(self, manager: SearchIndexerManager, data_source: azsdim.SearchIndexerDataSourceConnection):
         """
         Initialize a new DataSourceConnection.
@@ -3235,7 +4403,9 @@ class Indexer:
     """
     Represents an indexer in Azure AI Search.
     """
-    
+
+    __slots__ = ('manager', 'indexer')
+
     def __init__(self, manager: SearchIndexerManager, indexer: azsdim.SearchIndexer):
         """
         Initialize a new Indexer.
@@ -3307,7 +4477,9 @@ class Skillset:
     """
     Represents a skillset in Azure AI Search.
     """
-    
+
+    __slots__ = ('manager', 'skillset')
+
     def __init__(self, manager: SearchIndexerManager, skillset: azsdim.SearchIndexerSkillset):
         """
         Initialize a new Skillset.
@@ -3355,6 +4527,9 @@ class Skillset:
         self.manager.indexer_client.delete_skillset(self.skillset)
 
 class SearchIndex:
+    __slots__ = ('search_service', 'index_name', 'fields', 'vector_search',
+                 'azure_index', '_search_client_cache')
+
     index_name: str
     fields: List[azsdim.SearchField]
     vector_search: azsdim.VectorSearch
@@ -3366,6 +4541,10 @@ class SearchIndex:
         self.index_name = index_name
         self.fields = fields
         self.vector_search = vector_search
+        # Per-index-name SearchClient cache; constructing a client builds a
+        # whole pipeline, which is wasteful on hot search paths. Single-
+        # threaded construction is assumed, as elsewhere in this class.
+        self._search_client_cache: "OrderedDict[str, azsd.SearchClient]" = OrderedDict()
 
         # SimpleField, SearchableField, ComplexField, are derived from SearchField
         index_definition = azsdim.SearchIndex(name=self.index_name, fields=fields, vector_search=vector_search)
@@ -3374,14 +4553,25 @@ class SearchIndex:
     def get_search_client(self, index_name: Optional[str] = None ) -> azsd.SearchClient:
         if not index_name:
             index_name = self.index_name
-        search_client = self.search_service.search_client            
-        if search_client is None or search_client.index_name != index_name:
+        search_client = self.search_service.search_client
+        if search_client is not None and search_client.index_name == index_name:
+            return search_client
+        search_client = self._search_client_cache.get(index_name)
+        if search_client is None:
             search_client = azsd.SearchClient(
                 endpoint=self.search_service.get_service_endpoint(),
                 index_name=index_name,
-                credential=self.search_service.get_credential()
+                credential=self.search_service.get_credential(),
+                transport=_get_shared_transport()
             )
-        return search_client  
+            self._search_client_cache[index_name] = search_client
+            # Bounded LRU-style eviction so long-lived objects touching many
+            # indexes don't accumulate clients without limit
+            if len(self._search_client_cache) > 32:
+                self._search_client_cache.popitem(last=False)
+        else:
+            self._search_client_cache.move_to_end(index_name)
+        return search_client
 
     def extend_index_schema(self, new_fields: List[azsdim.SearchField] ) -> Optional[bool]:
         """
@@ -3396,41 +4586,50 @@ class SearchIndex:
         """
 
         try:
-            existing_field_names = [field.name for field in self.azure_index.fields]
-            
-            # Filter out any fields that already exist in the index
-            fields_to_add = [field for field in new_fields if field.name not in existing_field_names]
+            # Set membership keeps the duplicate check O(N + M) instead of
+            # rescanning the existing field list for every candidate
+            existing_field_names = {field.name for field in self.azure_index.fields}
+
+            # Filter out fields that already exist in the index, and dedupe
+            # repeated names within new_fields itself (first one wins)
+            fields_to_add = []
+            for field in new_fields:
+                if field.name not in existing_field_names:
+                    existing_field_names.add(field.name)
+                    fields_to_add.append(field)
             
             if not fields_to_add:
-                print("No new fields to add - all specified fields already exist in the index")
+                logger.info('No new fields to add - all specified fields already exist in the index')
                 return True
                 
             self.azure_index.fields.extend(fields_to_add)
             
             index_client: azsdi.SearchIndexClient = self.search_service.get_index_client()
             result: Optional[bool] = index_client.create_or_update_index(self.azure_index)
-            print(f"Successfully extended index '{self.index_name}' with {len(fields_to_add)} new fields")
+            logger.info("Successfully extended index '%s' with %d new fields", self.index_name, len(fields_to_add))
             
             # Return the updated index
             return result
             
         except Exception as e:
-            print(f"Error extending index: {str(e)}")
+            logger.exception("Error extending index")
             raise
 
     def process_data_in_batches(self, 
                                 index_name: Optional[str] = None,
                                 transaction: Callable[[List[Dict[str, Any]]], int] = None,
                                 search_text: str = "*",
-                                batch_size: int = 100 ) -> Tuple[int, int]:
+                                batch_size: int = 100,
+                                select: Optional[List[str]] = None ) -> Tuple[int, int]:
         '''
         Process data in batches from an Azure AI Search index
 
         Args:
-            index_name: Name of the index to process. If None, the current index is used. 
+            index_name: Name of the index to process. If None, the current index is used.
             transaction: Function to process a batch of documents. Gets a list of documents and returns the number of successful transactions. The transaction function could upload documents to the same or another index.
             batch_size: Number of documents to process in each batch
-        
+            select: Optional list of field names to retrieve. Projecting on the service keeps unneeded fields off the wire.
+
         Returns:
             Tuple of (succeeded_count, document_count)
 
@@ -3438,66 +4637,123 @@ class SearchIndex:
         if index_name is None:
             index_name = self.index_name
         search_client = self.get_search_client(index_name)
-        skip = 0
         document_count = 0
-        succeeded_count = 0 
-        
-        while True:
-            results = search_client.search( search_text=search_text, include_total_count=True, skip=skip, top=batch_size )
-            
-            # Get the total document count
-            if document_count == 0:
-                document_count = results.get_count()
-                print(f"Retrieved {document_count} documents to process")
-            
-            documents_to_process: List[Dict[str, Any]] = []
-            batch_documents: List[Dict[str, Any]] = list(results)
-            if not batch_documents:
-                break  # No more documents to process
-            
-            for doc in batch_documents:
-                documents_to_process.append(doc)
-            
-            # Upload the batch to the target index
-            if documents_to_process:
+        succeeded_count = 0
+
+        # skip/top pagination makes the service scan and discard skipped
+        # documents (O(N^2) total) and caps skip at 100k; by_page() streams
+        # server-side continuation tokens instead. No top= here: top caps the
+        # total result count, not the page size, and would truncate the run
+        results = search_client.search(search_text=search_text, select=select)
+
+        # Prefetch pages in a background thread so the next fetch overlaps
+        # the transaction instead of idling behind it
+        batches: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=2)
+        producer_error: List[BaseException] = []
+        # Set when the consumer unwinds (e.g. the transaction raised) so the
+        # producer never blocks forever on a full queue
+        stop_event = threading.Event()
+
+        def put_until_stopped(item: Optional[List[Dict[str, Any]]]) -> bool:
+            while not stop_event.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer() -> None:
+            try:
+                # Re-chunk service pages (up to 1000 documents each) into
+                # batch_size batches for the transaction
+                pending: List[Dict[str, Any]] = []
+                for page in results.by_page():
+                    pending.extend(page)
+                    while len(pending) >= batch_size:
+                        if not put_until_stopped(pending[:batch_size]):
+                            return
+                        pending = pending[batch_size:]
+                if pending:
+                    put_until_stopped(pending)
+            except BaseException as e:
+                producer_error.append(e)
+            finally:
+                put_until_stopped(None)
+
+        producer_thread = threading.Thread(target=producer, daemon=True)
+        producer_thread.start()
+
+        try:
+            while True:
+                documents_to_process = batches.get()
+                if documents_to_process is None:
+                    break
+                document_count += len(documents_to_process)
+
+                # Upload the batch to the target index
                 transaction_result = transaction(documents_to_process)
-                
+
                 succeeded_count += transaction_result
-                print(f"Processed batch: {transaction_result}/{len(documents_to_process)} documents (offset: {skip})")
-            
-            # Move to the next batch
-            skip += batch_size
-            
-            # Check if we've processed all documents
-            if skip >= document_count:
-                break
-        print(f"Successfully processed {succeeded_count}/{document_count} documents from  index '{index_name}'")
+                # Lazy %-interpolation: under the default WARNING level the
+                # message is never formatted, so the hot loop pays nothing
+                logger.debug('Processed batch: %d/%d documents (%d so far)',
+                             transaction_result, len(documents_to_process), document_count)
+        finally:
+            stop_event.set()
+            producer_thread.join()
+
+        if producer_error:
+            raise producer_error[0]
+
+        logger.info("Successfully processed %d/%d documents from index '%s'", succeeded_count, document_count, index_name)
         return (succeeded_count, document_count)
 
-    def upload_rows( self, documents: List[Dict[str, Any]], index_name: Optional[str] = None ) -> List[azsd._generated.models.IndexingResult]:
+    def upload_rows( self, documents: List[Dict[str, Any]], index_name: Optional[str] = None,
+                     sub_batch_size: int = 500, max_workers: int = 8 ) -> List[azsd._generated.models.IndexingResult]:
         """
         Upload documents to an Azure AI Search index
-        
+
+        Large document lists are partitioned into sub-batches uploaded in
+        parallel, which keeps the service's indexing threads busy instead of
+        feeding them one request at a time.
+
         Args:
             documents: List of documents to upload
             index_name: Name of the target index. If None, the current index is used.
-        
+            sub_batch_size: Documents per upload request (service cap is 1000 docs / 16 MB)
+            max_workers: Parallel upload requests for large document lists
+
         Returns:
-            Number of successfully uploaded documents
+            List of IndexingResult objects, one per document
         """
         try:
             if not index_name:
                 index_name = self.index_name
             search_client = self.get_search_client(index_name)
-            
-            # Upload documents to the target index
-            result = search_client.upload_documents(documents=documents)
-            
-            # Return the number of successfully uploaded documents
-            return result
+
+            # Small lists go out as a single request
+            if len(documents) <= sub_batch_size:
+                return self._upload_documents(search_client, documents)
+
+            sub_batches = [documents[i:i + sub_batch_size] for i in range(0, len(documents), sub_batch_size)]
+            results: List[azsd._generated.models.IndexingResult] = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._upload_documents, search_client, sub_batch)
+                           for sub_batch in sub_batches]
+                for future in as_completed(futures):
+                    results.extend(future.result())
+            return results
         except Exception as e:
-            print(f"Error uploading new index rows: {str(e)}")
+            logger.exception("Error uploading new index rows")
             raise e
+
+    @retry(wait=wait_exponential_jitter(initial=1, max=30), stop=stop_after_attempt(5),
+           retry=retry_if_exception_type((HttpResponseError, ConnectionError)))
+    def _upload_documents(self, search_client: azsd.SearchClient,
+                          documents: List[Dict[str, Any]]) -> List[azsd._generated.models.IndexingResult]:
+        """Upload one document batch with transient-error retries."""
+        return search_client.upload_documents(documents=documents)
     
 
     def copy_index_data(self, source_index_name: str, target_index_name: str, fields_to_copy: Optional[List[str]] = None, batch_size: int = 100) -> Tuple[int, int]:
@@ -3520,24 +4776,24 @@ class SearchIndex:
             print("Source and target index names are the same. No action taken.")
             return (0, 0)
         
-        target_client = self.get_search_client(target_index_name)
-        
         def copy_and_upload_documents(documents: List[Dict[str, Any]]) -> int:
-            documents_to_upload = []
-            for doc in documents:
-                # Create a new document with the selected fields
-                new_doc = {key: value for key, value in doc.items() if not fields_to_copy or (key in fields_to_copy) }
-                documents_to_upload.append(new_doc)            
-            # Upload the batch to the target index
+            # Field projection happens server-side via select, so the batch
+            # is uploaded as retrieved with no per-document rebuild.
+            # Upload through upload_rows, which re-chunks into 1000-document
+            # sub-batches (the service cap per indexing request) uploaded in
+            # parallel with exponential backoff on throttling
             succeeded = 0
-            if documents_to_upload:
-                result = target_client.upload_documents(documents=documents_to_upload)
-                
+            if documents:
+                result = self.upload_rows(documents, index_name=target_index_name,
+                                          sub_batch_size=1000, max_workers=4)
                 succeeded = sum(1 for r in result if r.succeeded)
 
             return succeeded
 
-        result = self.process_data_in_batches(index_name = source_index_name, transaction=copy_and_upload_documents)
+        result = self.process_data_in_batches(index_name = source_index_name,
+                                              transaction=copy_and_upload_documents,
+                                              batch_size=batch_size,
+                                              select=fields_to_copy)
         return result
 
     def copy_index_structure(self, fields_to_copy: Optional[List[str]] = None, new_index_name: Optional[str] = None ) -> azsdim.SearchIndex:
@@ -3592,12 +4848,12 @@ class SearchIndex:
             return result
             
         except Exception as e:
-            print(f"Error copying index structure: {str(e)}")
+            logger.exception("Error copying index structure")
             raise
 
     def perform_search(self, fields_to_select:List[str]=None, highlight_fields:str="chunk", highlight_pre_tag:str="<b>", highlight_post_tag:str="</b>", include_total_count:bool=True, filter_expression:Optional[str]=None, top:int=10,
                        query_text:Optional[str]=None, search_options:Optional[Dict[str, Any]]=None) -> azsd.SearchItemPaged[Dict[str, Any]]:
-        search_options = {
+        options: Dict[str, Any] = {
             "include_total_count": include_total_count,
             "select": fields_to_select,
             "highlight_fields": highlight_fields,
@@ -3605,50 +4861,77 @@ class SearchIndex:
             "highlight_post_tag": highlight_post_tag
         }
         if filter_expression:
-            search_options["filter"] = filter_expression
+            options["filter"] = filter_expression
         if top:
-            search_options["top"] = top
+            options["top"] = top
+        # Caller-supplied options (e.g. order_by) override the defaults
+        if search_options:
+            options.update(search_options)
         search_client = self.get_search_client()
-        results = search_client.search(query_text, **search_options)
+        results = search_client.search(query_text, **options)
         return results
     
-    def get_adjacent_chunks(self, all_chunks: List[Dict[str, Any]]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[Tuple[str, str], int]]:
-        # Organize chunks by parent_id
-        parent_chunks = defaultdict(list)
-        for chunk in all_chunks:
+    def get_adjacent_chunks(self, all_chunks: List[Dict[str, Any]],
+                            hit_keys: Optional[Set[Tuple[str, str]]] = None) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, int]]]:
+        """
+        Group chunks by parent document and order them by chunk id.
+
+        The sort key is total — every chunk id maps to a comparable tuple —
+        so ordering never raises and needs no exception-based fallback.
+
+        Args:
+            all_chunks: Chunk documents carrying parent_id and chunk_id keys
+            hit_keys: Optional (parent_id, chunk_id) pairs to restrict the position map to
+
+        Returns:
+            Tuple of (chunks grouped by parent_id, per-parent chunk_id-to-position maps)
+        """
+        # Bucketize by parent_id, computing each chunk's sort key exactly once
+        # (decorate-sort-undecorate). The composite key sorts numeric chunk
+        # ids first in numeric order, then everything else as strings, so
+        # mixed ids never raise during comparison; the sequence number breaks
+        # ties and keeps the sort stable without ever comparing the dicts.
+        parent_chunks: Dict[str, List[Tuple[Tuple[int, int, str], int, Dict[str, Any]]]] = defaultdict(list)
+        for seq, chunk in enumerate(all_chunks):
             if 'parent_id' in chunk and 'chunk_id' in chunk:
-                parent_chunks[chunk['parent_id']].append(chunk)
-        
+                chunk_id = chunk['chunk_id']
+                if '_' in chunk_id:
+                    suffix = chunk_id.rsplit('_', 1)[-1]
+                    key = (0, int(suffix), '') if suffix.isdigit() else (1, 0, chunk_id)
+                elif chunk_id.isdigit():
+                    key = (0, int(chunk_id), '')
+                else:
+                    key = (1, 0, chunk_id)
+                parent_chunks[chunk['parent_id']].append((key, seq, chunk))
+
         all_chunks_by_parent: Dict[str, List[Dict[str, Any]]] = {}
-        chunk_position_map: Dict[Tuple[str, str], int] = {}
-        # Sort chunks within each parent document and create position maps
-        for parent_id, chunks in parent_chunks.items():
-            # Try to sort chunks within each parent document
-            try:
-                # First try to sort by chunk_id if it contains a number
-                def extract_number(chunk: Dict[str, Any]) -> Union[int, str]:
-                    chunk_id = chunk.get('chunk_id', '')
-                    # Try to extract a number from the chunk_id
-                    if '_' in chunk_id:
-                        parts = chunk_id.split('_')
-                        if parts[-1].isdigit():
-                            return int(parts[-1])
-                    if chunk_id.isdigit():
-                        return int(chunk_id)
-                    return chunk_id  # Fall back to string sorting
-                
-                sorted_chunks = sorted(chunks, key=extract_number)
-            except:
-                # If sorting fails, keep the original order
-                sorted_chunks = chunks
-            
+        # Nested per-parent maps: lookups hash two strings instead of
+        # allocating and hashing a fresh (parent_id, chunk_id) tuple each time
+        chunk_position_map: Dict[str, Dict[str, int]] = {}
+        # Sort chunks within each parent document and create position maps;
+        # the decorated tuples compare natively in C with no key= callback
+        for parent_id, decorated in parent_chunks.items():
+            decorated.sort()
+            sorted_chunks = [chunk for _, _, chunk in decorated]
+
             # Store the sorted chunks
             all_chunks_by_parent[parent_id] = sorted_chunks
-            
-            # Create a position map for quick lookup
-            for i, chunk in enumerate(sorted_chunks):
-                chunk_position_map[(parent_id, chunk['chunk_id'])] = i
-            
+
+            # Fill the position map for quick lookup in one dict.update call,
+            # which consumes the generator in C instead of one bytecode-level
+            # store per chunk. When the caller names its hit chunks up front,
+            # only those positions are recorded — O(num_results) instead of
+            # O(total_chunks)
+            if hit_keys is None:
+                chunk_position_map[parent_id] = {
+                    chunk['chunk_id']: i for i, chunk in enumerate(sorted_chunks)
+                }
+            else:
+                chunk_position_map[parent_id] = {
+                    chunk['chunk_id']: i for i, chunk in enumerate(sorted_chunks)
+                    if (parent_id, chunk['chunk_id']) in hit_keys
+                }
+
         return all_chunks_by_parent, chunk_position_map
 
     def search_with_context_window(self,
@@ -3678,25 +4961,40 @@ class SearchIndex:
         results = []
         try:
             # Get initial search results
-            results = self.perform_hybrid_search(query_text=query_text, 
-                                            query_vector=query_vector, 
-                                            vector_fields=vector_fields, 
+            results = self.perform_hybrid_search(query_text=query_text,
+                                            query_vector=query_vector,
+                                            vector_fields=vector_fields,
                                             use_semantic_search=use_semantic_search,
                                             top=top,
                                             semantic_config_name=semantic_config_name,
                                             search_options=search_options)
-        except Exception as e:
+        except HttpResponseError as e:
+            # Only a bad search_options value justifies retrying without it;
+            # anything else (auth, throttling, network) would fail the same
+            # way again and is surfaced instead of costing a second call
+            message = str(e)
+            retriable = search_options and (
+                'InvalidRequestParameter' in message
+                or 'unknown field' in message.lower()
+                or 'invalid expression' in message.lower()
+            )
+            if not retriable:
+                logger.exception("Error performing hybrid search")
+                return []
             try:
                 # Get initial search results without search options
-                results = self.perform_hybrid_search(query_text=query_text, 
-                                                query_vector=query_vector, 
-                                                vector_fields=vector_fields, 
+                results = self.perform_hybrid_search(query_text=query_text,
+                                                query_vector=query_vector,
+                                                vector_fields=vector_fields,
                                                 use_semantic_search=use_semantic_search,
                                                 top=top,
                                                 semantic_config_name=semantic_config_name)
             except Exception as e:
-                print(f"Error performing hybrid search: {e}")
+                logger.exception("Error performing hybrid search")
                 return []
+        except Exception as e:
+            logger.exception("Error performing hybrid search")
+            return []
             
         # Check if results are empty
         if not results:
@@ -3712,63 +5010,75 @@ class SearchIndex:
             
             # Batch retrieve all chunks for all parent documents
             if parent_ids:
-                # Create a filter to get all chunks from all parent documents in one query
-                parent_filter = " or ".join([f"parent_id eq '{pid}'" for pid in parent_ids])
-                
-                # Retrieve all chunks (up to a reasonable limit)
                 search_options: Dict[str, Any] = {
                     "include_total_count": True,
                     "select": "*"
                 }
-                all_chunks = list(self.perform_search("*", 
-                                                    filter_expression=parent_filter,
-                                                    top=1000,  # Adjust based on your needs
+
+                def fetch_parent_chunks(pid: str) -> List[Dict[str, Any]]:
+                    # No top cap: SearchItemPaged follows server continuation
+                    # tokens, so iteration streams page by page instead of
+                    # either truncating or allocating for a hard-coded limit
+                    return list(self.perform_search("*",
+                                                    filter_expression=f"parent_id eq '{pid}'",
+                                                    top=None,
                                                     search_options=search_options))
-                
-                # Group chunks by parent_id
-                all_chunks_by_parent, chunk_position_map = self.get_adjacent_chunks(all_chunks)
-            
-            # Enrich results with context windows
-            enriched_results = []
+
+                all_chunks = []
+                if len(parent_ids) == 1:
+                    # One parent: a thread pool would only add overhead
+                    all_chunks = fetch_parent_chunks(next(iter(parent_ids)))
+                else:
+                    # One small query per parent, issued concurrently; wall
+                    # time approaches the slowest single-parent fetch instead
+                    # of the sum of all of them
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        futures = [executor.submit(fetch_parent_chunks, pid) for pid in parent_ids]
+                        for future in as_completed(futures):
+                            all_chunks.extend(future.result())
+
+                # Group chunks by parent_id; positions are only needed for
+                # the actual hits, so pass them in to keep the map small
+                hit_keys = {(result['parent_id'], result['chunk_id'])
+                            for result in results
+                            if 'parent_id' in result and 'chunk_id' in result}
+                all_chunks_by_parent, chunk_position_map = self.get_adjacent_chunks(all_chunks, hit_keys=hit_keys)
+            
+            # Append each hit and its context window straight to the output;
+            # the old enriched-results intermediate was flattened and thrown
+            # away immediately, costing a dict and two lists per hit
+            results_return: List[Dict[str, Any]] = []
+            # Hits clustered in one parent produce overlapping windows; track
+            # emitted chunks so each appears once instead of inflating the
+            # payload with duplicates
+            seen: Set[Tuple[str, str]] = set()
             for result in results:
                 parent_id = result.get('parent_id')
                 chunk_id = result.get('chunk_id')
-                
-                # Initialize empty context window
-                context_window: Dict[str, List[Dict[str, Any]]] = {
-                    'before': [],
-                    'after': []
-                }
-                
+
+                if parent_id and chunk_id:
+                    if (parent_id, chunk_id) not in seen:
+                        seen.add((parent_id, chunk_id))
+                        results_return.append(result)
+                else:
+                    results_return.append(result)
+
                 if parent_id and chunk_id and parent_id in all_chunks_by_parent:
                     parent_chunks = all_chunks_by_parent[parent_id]
-                    
+
                     # Find the position of this chunk
-                    position = chunk_position_map.get((parent_id, chunk_id))
-                    
+                    parent_positions = chunk_position_map.get(parent_id)
+                    position = parent_positions.get(chunk_id) if parent_positions else None
+
                     if position is not None:
-                        # Get previous chunks (up to window_size)
+                        # Previous and next chunks (up to window_size each)
                         start_idx = max(0, position - window_size)
-                        context_window['before'] = parent_chunks[start_idx:position]
-                        
-                        # Get next chunks (up to window_size)
                         end_idx = min(len(parent_chunks), position + window_size + 1)
-                        context_window['after'] = parent_chunks[position+1:end_idx]
-                
-                enriched_result = {
-                    'result': result,
-                    'context_window': context_window
-                }
-                
-                enriched_results.append(enriched_result)
-            
-            results_return = []
-            for result in enriched_results:
-                results_return.append(result['result'])
-                for chunk in result['context_window']['before']:
-                    results_return.append(chunk)
-                for chunk in result['context_window']['after']:
-                    results_return.append(chunk)
+                        for chunk in parent_chunks[start_idx:position] + parent_chunks[position+1:end_idx]:
+                            chunk_key = (parent_id, chunk['chunk_id'])
+                            if chunk_key not in seen:
+                                seen.add(chunk_key)
+                                results_return.append(chunk)
 
             return results_return
         else:
@@ -3788,7 +5098,9 @@ class SearchIndex:
                               vectorized_query_kind: str = "vector",
                               exhaustive: bool = False,
                               k_nearest_neighbors_vector_search: int = 50,
-                              query_answer: str = "extractive") -> List[Dict[str, Any]]:
+                              query_answer: str = "extractive",
+                              materialize: bool = True,
+                              serialize: bool = False) -> Union[List[Dict[str, Any]], azsd.SearchItemPaged, bytes]:
         """
         Perform a hybrid search combining traditional keyword search with vector search.
         Args:
@@ -3805,8 +5117,10 @@ class SearchIndex:
             exhaustive: Whether to trigger an exhaustive k-nearest neighbor search across all vectors within the vector index
             k_nearest_neighbors_vector_search: Number of nearest neighbors to return as top hits
             query_answer: This parameter is only valid if the query type is 'semantic'. If set, the query returns answers extracted from key passages in the highest ranked documents
+            materialize: Whether to convert results to a list of plain dicts. Pass False to get the lazy paged iterator and skip the per-result dict rebuild.
+            serialize: Whether to return the results as JSON bytes in one serialization pass, for callers that would immediately json-dump the list anyway.
         Returns:
-            A list of search results
+            A list of search results, the SearchItemPaged iterator when materialize is False, or JSON bytes when serialize is True
         """
         # Default vector fields if not provided
         if vector_fields is None:
@@ -3844,21 +5158,192 @@ class SearchIndex:
         # Execute the search
         search_client = self.get_search_client()
         results = search_client.search(**default_options)
-        
+
+        # Results are already mapping-like; skip the per-result dict rebuild
+        # (O(k * fields) allocations) when the caller just iterates
+        if not materialize:
+            return results
+
+        # Prefetch pages in a background thread so fetching page N+1
+        # overlaps the dict conversion of page N, as in
+        # process_data_in_batches
+        pages: "queue.Queue[Optional[List[Any]]]" = queue.Queue(maxsize=2)
+        fetch_error: List[BaseException] = []
+        # Set when the consumer unwinds so the producer never blocks forever
+        # on a full queue
+        stop_event = threading.Event()
+
+        def put_until_stopped(item: Optional[List[Any]]) -> bool:
+            while not stop_event.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer() -> None:
+            try:
+                for page in results.by_page():
+                    if not put_until_stopped(list(page)):
+                        return
+            except BaseException as e:
+                fetch_error.append(e)
+            finally:
+                put_until_stopped(None)
+
+        producer_thread = threading.Thread(target=producer, daemon=True)
+        producer_thread.start()
+
         # Process and return the results
         processed_results = []
-        for result in results:
-            processed_result = dict(result)
-            processed_results.append(processed_result)
-        
-        return processed_results    
+        try:
+            while True:
+                page_results = pages.get()
+                if page_results is None:
+                    break
+                processed_results.extend(dict(result) for result in page_results)
+        finally:
+            stop_event.set()
+            producer_thread.join()
+
+        if fetch_error:
+            raise fetch_error[0]
+
+        if serialize:
+            # One C-level pass over the dicts instead of a caller-side
+            # json.dumps re-walking every result
+            return _dumps_result_bytes(processed_results)
+
+        return processed_results
         
 from docx.document import Document as DocumentObject
 from docx.text.paragraph import Paragraph
 from docx.table import Table
 from docx.section import Section
+from docx.oxml.ns import qn
 import tiktoken
 from tiktoken import Encoding
+from bisect import bisect_left
+
+# Resolved element tags for direct XML table scans
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_T = qn('w:t')
+_W_P = qn('w:p')
+_W_TBL = qn('w:tbl')
+_W_SECTPR = qn('w:sectPr')
+
+def _extract_table_text(table: Table) -> str:
+    """
+    Extract a table's text straight from its XML element.
+
+    python-docx's row/cell wrappers rebuild Python objects and walk each
+    cell subtree per access; reading the w:t text nodes directly keeps the
+    traversal inside lxml.
+
+    Parameters:
+        table: Python-docx Table object.
+
+    Returns:
+        Rows joined with newlines, cells joined with ' - '.
+    """
+    data = []
+    for row in table._tbl.findall(_W_TR):
+        texts = [''.join(t.text or '' for t in tc.iter(_W_T)).strip()
+                 for tc in row.findall(_W_TC)]
+        texts = [t for t in texts if t]
+        if texts:
+            data.append(' - '.join(texts))
+    return '\n'.join(data)
+
+# Shared cl100k_base encoding: loading the BPE vocabulary is expensive (and
+# may download it over HTTPS on a cold cache), so every parser instance
+# shares one copy resolved lazily on first use — never at import, which must
+# work offline for users who don't tokenize
+@lru_cache(maxsize=None)
+def _get_cl100k_base() -> Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+# Header-parsing patterns are constant; compiled once at module scope so the
+# per-section parsers don't pay a re.compile (and its cache lookup) per call.
+# Pattern to catch numbered sections in Greek documents
+_HEADER_NUMBER_RE = re.compile(r'^\s*(\d+(?:\.\d+)*\.?)\s*$')
+# Pattern for table cell format: "| 1. | Process Name |"
+_HEADER_TABLE_RE = re.compile(r'^\s*\|\s*(\d+(?:\.\d+)*\.?)\s*\|\s*(.*?)\s*\|')
+# Pattern for text format with edition info
+_HEADER_EDITION_RE = re.compile(r'^Εκδ\.\s+\d+\/\d+\.\d+\.\d+\s+Σελ\.\s+\d+$')
+# Pattern for direct number + title format
+_HEADER_DIRECT_RE = re.compile(r'^(\d+(?:\.\d+)*\.?)\s+(.*?)$')
+# Pattern for process numbers (e.g., 1., 1.1., 1.1.1.)
+_PROCESS_NUMBER_RE = re.compile(r'^\d+(\.\d+)*\.$')
+# Metadata lines to ignore, folded into one alternation (e.g. edition/page marks)
+_META_RE = re.compile(r'^Εκδ\.|Σελ\.')
+# Characters not allowed in section keys/filenames
+_SANITIZE_RE = re.compile(r'[\\/*?:"<>|]')
+# Single alternation combining the four header patterns above; one match call
+# classifies a line instead of four sequential Python-to-C regex transitions
+_HEADER_COMBINED_RE = re.compile(
+    r'^\s*\|\s*(?P<table_num>\d+(?:\.\d+)*\.?)\s*\|\s*(?P<table_title>.*?)\s*\|'
+    r'|(?P<edition>^Εκδ\.\s+\d+\/\d+\.\d+\.\d+\s+Σελ\.\s+\d+$)'
+    r'|^(?P<direct_num>\d+(?:\.\d+)*\.?)\s+(?P<direct_title>.*?)$'
+    r'|^\s*(?P<number>\d+(?:\.\d+)*\.?)\s*$'
+)
+
+from pathlib import Path
+
+# On-disk cache for deterministic (temperature=0) LLM responses: reprocessing
+# a document whose sections have not changed costs zero API calls, since the
+# key covers the model, temperature and full prompt content
+def _llm_cache_key(model: str, temperature: float, system_content: str, user_content: str) -> str:
+    """Derive a stable cache key from everything that shapes the response."""
+    payload = f'{model}\0{temperature}\0{system_content}\0{user_content}'
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def _find_balanced_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} block in text, or None.
+
+    One linear pass driven by str.find jumps, replacing the greedy
+    DOTALL regex that rescans the whole response on malformed output.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    i = start
+    while True:
+        open_idx = text.find('{', i)
+        close_idx = text.find('}', i)
+        if close_idx == -1:
+            return None
+        if open_idx != -1 and open_idx < close_idx:
+            depth += 1
+            i = open_idx + 1
+        else:
+            depth -= 1
+            i = close_idx + 1
+            if depth == 0:
+                return text[start:i]
+
+def _llm_cache_get(cache_dir: Path, key: str) -> Optional[str]:
+    """Return the cached response text for key, or None on a miss."""
+    path = cache_dir / key[:2] / key
+    try:
+        if path.exists():
+            return path.read_text(encoding='utf-8')
+    except OSError:
+        logger.debug('Failed to read LLM cache entry %s', path, exc_info=True)
+    return None
+
+def _llm_cache_put(cache_dir: Path, key: str, response_text: str) -> None:
+    """Store a response under key; cache failures never break the pipeline."""
+    try:
+        bucket = cache_dir / key[:2]
+        bucket.mkdir(parents=True, exist_ok=True)
+        (bucket / key).write_text(response_text, encoding='utf-8')
+    except OSError:
+        logger.debug('Failed to write LLM cache entry %s', key, exc_info=True)
 
 class GenDocParsing:
     """
@@ -3876,7 +5361,10 @@ class GenDocParsing:
         print(f"Initializing GenDocParsing")
         self.openai_client = openai_client
         self.model_name = model_name
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.tokenizer = _get_cl100k_base()
+        # Deterministic summarization calls are cached on disk so re-ingesting
+        # an unchanged document skips the LLM entirely
+        self._cache_dir = Path('.llm_cache')
  
     def get_section_header_lines(self, section: Section):
         """
@@ -3916,72 +5404,85 @@ class GenDocParsing:
 
         Parameters:
             header_lines: List of text lines from the section header.
-        
+
         Returns:
             The identified title segment in the provided lines.
         """
-        # Pattern to catch numbered sections in Greek documents
-        number_pattern = re.compile(r'^\s*(\d+(?:\.\d+)*\.?)\s*$')
-       
-        # Pattern for table cell format: "| 1. | Process Name |"
-        table_pattern = re.compile(r'^\s*\|\s*(\d+(?:\.\d+)*\.?)\s*\|\s*(.*?)\s*\|')
-       
-        # Pattern for text format with edition info
-        edition_pattern = re.compile(r'^Εκδ\.\s+\d+\/\d+\.\d+\.\d+\s+Σελ\.\s+\d+$')
-       
-        # Pattern for direct number + title format
-        direct_pattern = re.compile(r'^(\d+(?:\.\d+)*\.?)\s+(.*?)$')
- 
+        title = self.parse_header_lines_fast(header_lines)
+        if title is not None or not header_lines:
+            return title
+        return self.resolve_header_with_llm(header_lines)
+
+    def parse_header_lines_fast(self, header_lines: List[str]) -> Optional[str]:
+        """
+        Regex-only header parsing; returns None when no pattern matches.
+
+        Parameters:
+            header_lines: List of text lines from the section header.
+
+        Returns:
+            The identified title segment, or None if unresolved.
+        """
         if not header_lines:
             return None
-       
+
+        # Classify every line with one combined-alternation match, then apply
+        # the priority rules over the cached match objects
+        matches = [_HEADER_COMBINED_RE.match(line) for line in header_lines]
+
         # First check for table format - this is highest priority for Format 1
-        for line in header_lines:
-            table_match = table_pattern.match(line)
-            if table_match and table_match.group(2).strip():
-                return table_match.group(2).strip()  # Return the section name part
-       
+        for m in matches:
+            if m and m.group('table_num') is not None and m.group('table_title').strip():
+                return m.group('table_title').strip()  # Return the section name part
+
         # Next, handle the case, edition info followed by non-numbered title
-        has_edition_line = False
         edition_line_index = -1
-       
-        for i, line in enumerate(header_lines):
-            if edition_pattern.match(line):
-                has_edition_line = True
+        for i, m in enumerate(matches):
+            if m and m.group('edition') is not None:
                 edition_line_index = i
                 break
-       
-        if has_edition_line and edition_line_index + 1 < len(header_lines):
+
+        if edition_line_index != -1 and edition_line_index + 1 < len(header_lines):
             next_line = header_lines[edition_line_index + 1].strip()
-           
+            # Re-match on the stripped line, as the numbered-title pattern is
+            # anchored at the first digit
+            next_match = _HEADER_COMBINED_RE.match(next_line)
+
             # First, try to match as numbered title
-            direct_match = direct_pattern.match(next_line)
-            if direct_match:
-                return direct_match.group(2).strip()
-           
+            if next_match and next_match.group('direct_num') is not None:
+                return next_match.group('direct_title').strip()
+
             # If the line after edition info isn't a numbered title but has content, it's non-numbered title
             elif next_line and len(next_line) > 3:
                 # Make sure this line isn't matching our table pattern
-                if not table_pattern.match(next_line):
+                if not (next_match and next_match.group('table_num') is not None):
                     return next_line
-       
+
         # Check for direct number + title format
-        for line in header_lines:
-            direct_match = direct_pattern.match(line)
-            if direct_match:
-                return direct_match.group(2).strip()
-       
+        for m in matches:
+            if m and m.group('direct_num') is not None:
+                return m.group('direct_title').strip()
+
         # Check for just numeric pattern
-        for i, line in enumerate(header_lines):
-            line_stripped = line.strip()
-            # Check for numeric pattern
-            if number_pattern.match(line_stripped):
+        for i, m in enumerate(matches):
+            if m and m.group('number') is not None:
                 # Use the next line (if present) as the title
                 if i + 1 < len(header_lines):
                     header_title = header_lines[i + 1].strip()
-                    return header_title        
-        
-        # Otherwise utilize LLM        
+                    return header_title
+
+        return None
+
+    def resolve_header_with_llm(self, header_lines: List[str]) -> str:
+        """
+        Ask the LLM for the section title when no regex pattern matched.
+
+        Parameters:
+            header_lines: List of text lines from the section header.
+
+        Returns:
+            The title proposed by the model.
+        """
         content = ""
         for line in header_lines:
             content += line + "\n"
@@ -4043,23 +5544,42 @@ class GenDocParsing:
        
         # Pre-scan for all section breaks to determine total sections
         section_breaks = doc._element.xpath(".//w:sectPr")
-       
+
+        # Map each break to the top-level block containing it, so the loop
+        # below does an O(1) set lookup per block instead of re-running an
+        # xpath query against every paragraph and table subtree. The block
+        # proxies must stay referenced for the generator's lifetime: lxml
+        # proxies are ephemeral and their id()s get recycled once freed,
+        # which would make the id() membership test match the wrong blocks
+        break_blocks = []
+        for sectPr in section_breaks:
+            ancestor = sectPr.getparent()
+            while ancestor is not None:
+                parent = ancestor.getparent()
+                if parent is parent_elm:
+                    break_blocks.append(ancestor)
+                    break
+                ancestor = parent
+        blocks_with_break = {id(block) for block in break_blocks}
+
         try:
             # First, try to extract section properties if available
             for i, sectPr in enumerate(section_breaks):
                 section_properties[i] = {
                     "index": i,
                 }
-           
-            # Iterate through all blocks
+
+            # Iterate through all blocks; exact qualified-name comparisons
+            # replace the per-child endswith scans with one hash compare
             for child in parent_elm.iterchildren():
                 try:
-                    if child.tag.endswith("p"):
+                    tag = child.tag
+                    if tag == _W_P:
                         # Process paragraph
                         paragraph = Paragraph(child, doc)
                        
                         # Check if this paragraph contains a section break
-                        has_section_break = bool(child.xpath(".//w:sectPr"))
+                        has_section_break = id(child) in blocks_with_break
                        
                         # First yield the paragraph with current section
                         yield current_section_index, paragraph, section_properties.get(current_section_index, {})
@@ -4068,12 +5588,12 @@ class GenDocParsing:
                         if has_section_break:
                             current_section_index += 1
                    
-                    elif child.tag.endswith("tbl"):
+                    elif tag == _W_TBL:
                         # Process table
                         table = Table(child, doc)
                        
                         # Check if this table contains a section break
-                        has_section_break = bool(child.xpath(".//w:sectPr"))
+                        has_section_break = id(child) in blocks_with_break
                        
                         # Yield the table with current section
                         yield current_section_index, table, section_properties.get(current_section_index, {})
@@ -4083,11 +5603,11 @@ class GenDocParsing:
                             current_section_index += 1
                    
                 except Exception as e:
-                    print(f"Error processing document element: {e}")
+                    logger.exception("Error processing document element")
                     continue
        
         except Exception as e:
-            print(f"Error in document iteration: {e}")
+            logger.exception("Error in document iteration")
             # Yield what we have so far
             yield current_section_index, None, {"error": str(e)}
  
@@ -4101,14 +5621,7 @@ class GenDocParsing:
         Returns:
             Joined cells with ' - '.
         """
-        data = []
-        for row in table.rows:
-            row_cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-            # row as string
-            if row_cells:
-                row_string = ' - '.join(row_cells)  # Join cells with a space or another separator
-                data.append(row_string)
-        return '\n'.join(data)
+        return _extract_table_text(table)
    
     def extract_data(self, doc_instance: DocumentObject, doc_name: str):
         """
@@ -4126,72 +5639,138 @@ class GenDocParsing:
         doc = doc_instance
         # Dictionary to store sections: {section_title: section_content}
         sections_dict = {}
-       
-        # First, identify all sections in the document
+
+        # Single pass: section markers are discovered lazily at the first
+        # block of each section index, which always precedes that section's
+        # content, so one traversal replaces the old identify-then-collect
+        # double iteration (and its duplicate Paragraph/Table construction)
         section_markers = {}  # Maps section_index to section_title
-       
+        headers_checked = set()  # Section indexes already resolved (even to None)
+        current_section_title = None
+        # Content buffered in case no section headers are found anywhere
+        fallback_content = []
+        # Headers the regex parser couldn't resolve; their LLM round-trips
+        # are deferred and issued concurrently after the pass instead of one
+        # blocking call per section
+        pending_headers: Dict[str, List[str]] = {}
+        # Normalized titles discovered so far; paragraph-vs-header dedupe is
+        # an O(1) membership test against this set instead of re-running the
+        # header parser on every paragraph
+        header_titles_norm: Set[str] = set()
+
+        # doc.sections rebuilds its wrapper list on every access; bind it
+        # (and its length) once outside the loop
+        sections = doc.sections
+        n_sections = len(sections)
+
         for section_index, block, _ in self.iterate_block_items_with_section(doc):
-            # If this is a new section index we haven't seen
-            if section_index not in section_markers:
+            # If this is a new section index we haven't seen; headers are
+            # parsed at most once per index thanks to this check
+            if section_index not in headers_checked:
+                headers_checked.add(section_index)
                 # Get section header if available
-                if section_index < len(doc.sections):
-                    header_title = self.extract_header_info(doc.sections[section_index])
+                if section_index < n_sections:
+                    try:
+                        header_lines = self.get_section_header_lines(sections[section_index])
+                        header_title = self.parse_header_lines_fast(header_lines)
+                    except Exception as e:
+                        header_lines = []
+                        header_title = None
+                    if header_title is None and header_lines:
+                        # Placeholder key; swapped for the LLM answer below
+                        header_title = f"__pending_header_{section_index}__"
+                        pending_headers[header_title] = header_lines
                     if header_title:
                         # Use a clean section name (without special formatting)
                         clean_section_name = f"{header_title.strip()}"
                         section_markers[section_index] = clean_section_name
+                        if not clean_section_name.startswith('__pending_header_'):
+                            header_titles_norm.add(clean_section_name.casefold())
                         # Initialize empty content list for this section
                         if clean_section_name not in sections_dict:
                             sections_dict[clean_section_name] = []
-       
-        # If no sections were found, treat the whole document as one section
-        if not section_markers:
-            section_markers[0] = doc_name
-            sections_dict[doc_name] = []
-       
-        # Second, collect content for each section
-        current_section_title = None
-       
-        for section_index, block, _ in self.iterate_block_items_with_section(doc):
+
             # Get current section name
             current_section_title = section_markers.get(section_index, current_section_title)
-           
-            # Skip if we don't have a section name or it's not in our dictionary
-            if not current_section_title or current_section_title not in sections_dict:
-                continue
-           
-            # Process paragraph content
+
+            # Extract the block's content once
             if isinstance(block, Paragraph) and block.text and block.text.strip():
-                # Skip lines that appear to be section headers to avoid duplication
-                paragraph_text = block.text.strip()
-                is_header_line = False
-                
-                # Check if this paragraph text contains the section name
-                detected_title = self.parse_header_lines([paragraph_text])
-                if detected_title and detected_title.strip() == current_section_title.strip():
-                    is_header_line = True
-               
-                # Only add content that isn't a header line
-                if not is_header_line:
-                    sections_dict[current_section_title].append(paragraph_text)
-           
-            # Process table content
+                block_text = block.text.strip()
+                is_paragraph = True
             elif isinstance(block, Table):
-                table_data = self.extract_table_data(block)
-                if table_data.strip():
-                    sections_dict[current_section_title].append(table_data)
-       
-        # Convert content lists to strings
-        for section_name, content_list in sections_dict.items():
-            if content_list:
-                sections_dict[section_name] = "\n".join(content_list)
+                block_text = self.extract_table_data(block)
+                if not block_text.strip():
+                    continue
+                is_paragraph = False
             else:
-                sections_dict[section_name] = ""
-       
-        # Remove empty sections and "Metadata" sections
-        sections_dict = {k: v for k, v in sections_dict.items() if v.strip() and k != "Metadata"}
-       
-        return sections_dict
+                continue
+
+            # While no section header has been found yet, keep the content
+            # around for the whole-document fallback below
+            if not section_markers:
+                fallback_content.append((is_paragraph, block_text))
+
+            # Skip if we don't have a section name or it's not in our dictionary
+            if not current_section_title or current_section_title not in sections_dict:
+                continue
+
+            if is_paragraph:
+                # Skip lines that repeat a known section header to avoid
+                # duplication; a set membership test covers plain title lines,
+                # and the regex parser only runs for numbered/table-style
+                # lines whose title is embedded in extra formatting
+                if block_text.casefold() in header_titles_norm:
+                    continue
+                first_char = block_text[0]
+                if first_char.isdigit() or first_char == '|':
+                    detected_title = self.parse_header_lines_fast([block_text])
+                    if detected_title and detected_title.strip().casefold() in header_titles_norm:
+                        continue
+
+            sections_dict[current_section_title].append(block_text)
+
+        # Resolve the deferred headers with concurrent LLM calls and swap the
+        # placeholder section keys for the real titles
+        if pending_headers:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {placeholder: executor.submit(self.resolve_header_with_llm, lines)
+                           for placeholder, lines in pending_headers.items()}
+            for placeholder, future in futures.items():
+                try:
+                    title = future.result()
+                    clean_section_name = title.strip() if title and title.strip() else None
+                except Exception as e:
+                    logger.exception("Error resolving section header with LLM")
+                    clean_section_name = None
+                if not clean_section_name:
+                    # Fall back to the first header line so content survives
+                    clean_section_name = pending_headers[placeholder][0].strip()
+                content = sections_dict.pop(placeholder, [])
+                sections_dict.setdefault(clean_section_name, []).extend(content)
+
+        # If no sections were found, treat the whole document as one section
+        if not section_markers:
+            doc_name_norm = doc_name.strip().casefold()
+            section_contents = []
+            for is_paragraph, block_text in fallback_content:
+                if is_paragraph:
+                    if block_text.casefold() == doc_name_norm:
+                        continue
+                    first_char = block_text[0]
+                    if first_char.isdigit() or first_char == '|':
+                        detected_title = self.parse_header_lines_fast([block_text])
+                        if detected_title and detected_title.strip().casefold() == doc_name_norm:
+                            continue
+                section_contents.append(block_text)
+            sections_dict = {doc_name: section_contents}
+
+        # Join content lists into strings, dropping empty and "Metadata"
+        # sections in the same pass
+        return {
+            section_name: "\n".join(content_list)
+            for section_name, content_list in sections_dict.items()
+            if section_name != "Metadata" and any(block.strip() for block in content_list)
+        }
     
     def chunk_section_content(self, section_content: str, chunk_size=1500, overlap=150):
         """
@@ -4212,49 +5791,41 @@ class GenDocParsing:
         paragraphs = re.split(r'\n+', section_content) # Splits the text at paragraph boundaries (multiple newlines)
         paragraphs = [p.strip() for p in paragraphs if p.strip()] # Remove empty paragraphs and strip whitespace
        
-        # Calculate tokens for each paragraph
-        paragraph_tokens = []
-        for p in paragraphs:
-            tokens = len(self.tokenizer.encode(p))
-            paragraph_tokens.append((p, tokens))
-       
-        # Create chunks based on token count
+        # Tokenize all paragraphs in one batched call — a single FFI crossing
+        # that tiktoken parallelizes internally
+        lengths = [len(ids) for ids in self.tokenizer.encode_ordinary_batch(paragraphs)]
+        paragraph_tokens = list(zip(paragraphs, lengths))
+
+        # Create chunks based on token count; current_chunk carries each
+        # paragraph with its token count, and cum[i] holds the token total of
+        # the first i paragraphs, so the overlap boundary is a binary search
+        # over the cumulative sums — no tokenizer calls, no head inserts
         chunks = []
-        current_chunk = []
-        current_token_count = 0
-       
-        for i, (paragraph, tokens) in enumerate(paragraph_tokens):
+        current_chunk: List[Tuple[str, int]] = []
+        cum = [0]
+
+        for paragraph, tokens in paragraph_tokens:
             # If adding this paragraph would exceed chunk size and we already have content
-            if current_token_count + tokens > chunk_size and current_chunk:
+            if cum[-1] + tokens > chunk_size and current_chunk:
                 # Join current chunk and add to chunks list
-                chunks.append("\n\n".join(current_chunk))
-               
-                # Start new chunk with overlap
-                # Find paragraphs from the previous chunk to include as overlap
-                overlap_token_count = 0
-                overlap_paragraphs = []
-               
-                # Go backwards through current_chunk to find overlap paragraphs
-                for p in reversed(current_chunk):
-                    p_tokens = len(self.tokenizer.encode(p))
-                    if overlap_token_count + p_tokens <= overlap:
-                        overlap_paragraphs.insert(0, p)
-                        overlap_token_count += p_tokens
-                    else:
-                        break
-               
-                # Start new chunk with overlap paragraphs
-                current_chunk = overlap_paragraphs
-                current_token_count = overlap_token_count
-           
+                chunks.append("\n\n".join(p for p, _ in current_chunk))
+
+                # First index whose suffix fits inside the overlap budget
+                cut = bisect_left(cum, cum[-1] - overlap)
+
+                # Start new chunk with the overlap paragraphs
+                current_chunk = current_chunk[cut:]
+                base = cum[cut]
+                cum = [c - base for c in cum[cut:]]
+
             # Add current paragraph to chunk
-            current_chunk.append(paragraph)
-            current_token_count += tokens
-       
+            current_chunk.append((paragraph, tokens))
+            cum.append(cum[-1] + tokens)
+
         # Add the last chunk if it has content
         if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
-       
+            chunks.append("\n\n".join(p for p, _ in current_chunk))
+
         return chunks
    
     def generate_section_summary(self, section_title: str, chunks: List[str], max_length=1000):
@@ -4269,6 +5840,19 @@ class GenDocParsing:
         Returns:
             str: Generated summary of the section
         """
+        # Static instruction block kept byte-identical across calls so the
+        # service's prompt-prefix cache can reuse it; every dynamic field
+        # (length, title, content) lives in the user message instead
+        system_prompt = (
+            "You are a domain-aware summarization engine designed to generate accurate summaries of banking procedures.\n"
+            "Instructions:\n"
+            "- Analyze the content and extract the most relevant and retrievable information.\n"
+            "- Preserve key entities, concepts, steps, definitions, and decision points.\n"
+            "- Avoid generalizations, vague language, and redundant phrasing.\n"
+            "- Avoid introductions and stick **ONLY** to the the summary itself.\n"
+            "- Generate a summary in GREEK that strictly adheres to the above constraints."
+        )
+
         def summarize_text(title, content, max_length):
             import math
             word_number = math.ceil(max_length / 3)  # average tokens per word - for greek language
@@ -4279,54 +5863,129 @@ class GenDocParsing:
                 prompt = f"""
                 Summary Length: Summary length should be at \"{word_number}\" words.
                 Document Title: \"{title}\"
-    
-                Instructions:
-                - Analyze the content and extract the most relevant and retrievable information.
-                - Preserve key entities, concepts, steps, definitions, and decision points.
-                - Avoid generalizations, vague language, and redundant phrasing.
-                - Avoid introductions and stick **ONLY** to the the summary itself.
-    
+
                 Content to Summarize:
                 \"\"\"
                 {content}
                 \"\"\"
-    
-                Generate a summary in GREEK below that strictly adheres to the above constraints.
                 """
-    
+
                 messages = [
-                    {"role": "system", "content": "You are a domain-aware summarization engine designed to generate accurate summaries of banking procedures."},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ]
-                
+
+                cache_key = _llm_cache_key(self.model_name, 0, system_prompt, prompt)
+                cached = _llm_cache_get(self._cache_dir, cache_key)
+                if cached is not None:
+                    return cached
+
                 response = self.openai_client.generate_chat_completion(
                     model=self.model_name,
                     messages=messages,
                     temperature=0,
                     max_tokens= None
                 )
-                    
-                return response['content']
+
+                content = response['content']
+                if content:
+                    _llm_cache_put(self._cache_dir, cache_key, content)
+                return content
             except Exception as e:
-                print(f"Error in API call: {e}")
+                logger.exception("Error in API call")
                 return f"Error generating summary: {str(e)}"
+
+        def summarize_chunk_group(title, group_chunks):
+            """
+            Summarize several chunks with one call returning a JSON array.
+            Returns the list of summaries, or None so the caller can fall
+            back to per-chunk calls.
+            """
+            numbered = "\n\n".join(f"--- Chunk {i+1} ---\n{c}" for i, c in enumerate(group_chunks))
+            prompt = f"""
+            Section Title: \"{title}\"
+
+            Instructions:
+            - Below are {len(group_chunks)} separate content chunks from the section.
+            - Summarize EACH chunk separately, in GREEK, at about 70 words each.
+            - Preserve key entities, concepts, steps, definitions, and decision points.
+            - Avoid generalizations, vague language, and redundant phrasing.
+            - Respond with a JSON object of the form {{"summaries": ["...", "..."]}} containing exactly {len(group_chunks)} strings, in the same order as the chunks.
+
+            Chunks to Summarize:
+            {numbered}
+            """
+
+            messages = [
+                {"role": "system", "content": "You are a domain-aware summarization engine designed to generate accurate summaries of banking procedures."},
+                {"role": "user", "content": prompt}
+            ]
+            try:
+                response = self.openai_client.generate_chat_completion(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=0,
+                    max_tokens=None,
+                    response_format={"type": "json_object"}
+                )
+                summaries = json.loads(response['content'])['summaries']
+                if isinstance(summaries, list) and len(summaries) == len(group_chunks):
+                    return [str(s) for s in summaries]
+            except Exception as e:
+                logger.exception("Error in marshaled chunk summarization")
+            return None
+
         try:
+            # Very small sections are their own summary and need no LLM
+            # call; anything larger still gets a real summary so the indexed
+            # field never silently becomes raw text
+            joined = "\n\n".join(chunks)
+            if len(self.tokenizer.encode(joined)) <= 200:
+                return joined
+
             # If there's only one small chunk, summarize it directly
             if len(chunks) == 1 and len(self.tokenizer.encode(chunks[0])) < 6000:
                 return summarize_text(section_title, chunks[0], max_length)
-           
-            # For multiple chunks or large chunks, summarize each chunk first
-            chunk_summaries = []
+
+            # Pack chunks into groups that fit the marshaling token budget;
+            # each group is summarized by a single call that returns one
+            # summary per chunk, so a section pays one round-trip per group
+            # instead of one per chunk
+            marshal_budget = 6000
+            groups: List[List[Tuple[int, str]]] = []
+            group: List[Tuple[int, str]] = []
+            group_tokens = 0
             for i, chunk in enumerate(chunks):
-                chunk_summary = summarize_text(f"Chunk {i+1}/{len(chunks)} of section: {section_title}", chunk, 200)
-                chunk_summaries.append(chunk_summary)
-           
+                chunk_tokens = len(self.tokenizer.encode(chunk))
+                if group and group_tokens + chunk_tokens > marshal_budget:
+                    groups.append(group)
+                    group = []
+                    group_tokens = 0
+                group.append((i, chunk))
+                group_tokens += chunk_tokens
+            if group:
+                groups.append(group)
+
+            chunk_summaries: List[str] = [''] * len(chunks)
+            for group in groups:
+                group_result = None
+                if len(group) > 1:
+                    group_result = summarize_chunk_group(section_title, [chunk for _, chunk in group])
+                if group_result is not None:
+                    for (i, _), chunk_summary in zip(group, group_result):
+                        chunk_summaries[i] = chunk_summary
+                else:
+                    # Single-chunk group, or the batched call failed to
+                    # produce a parseable array: summarize chunk by chunk
+                    for i, chunk in group:
+                        chunk_summaries[i] = summarize_text(f"Chunk {i+1}/{len(chunks)} of section: {section_title}", chunk, 200)
+
             # Then summarize the combined chunk summaries
             combined_summaries = "\n\n".join(chunk_summaries)
             return summarize_text(f"Complete section: {section_title}", combined_summaries, max_length)
                
         except Exception as e:
-            print(f"Error generating summary for section '{section_title}': {e}")
+            logger.exception(f"Error generating summary for section '{section_title}'")
             return f"Error generating summary: {str(e)}"
        
     def process_document_with_summaries(self, doc_instance: DocumentObject, doc_name: str):
@@ -4344,24 +6003,43 @@ class GenDocParsing:
        
         # Extract sections
         sections_dict = self.extract_data(doc_instance, doc_name)
-       
-        # Process each section
-        processed_sections = {}
-       
-        for section_title, section_content in sections_dict.items():
+
+        def process_section(section_title: str, section_content: str) -> Tuple[str, Dict[str, Any]]:
             print(f"Processing section: {section_title}")
-           
+
             # Generate summary for the section
             # Chunk the section content
             chunks = self.chunk_section_content(section_content)
- 
+
             summary = self.generate_section_summary(section_title, chunks)
-           
-            processed_sections[section_title] = {
+
+            return section_title, {
                 "summary": summary,
                 "chunks": chunks
             }
-       
+
+        # Process each section; summarization is network-bound LLM latency,
+        # so sections run concurrently and wall time approaches the slowest
+        # section instead of the sum. The worker bound keeps request rate
+        # within the service budget, and the per-call retries with
+        # exponential jitter in generate_chat_completion absorb 429s.
+        processed_sections = {}
+        sections = list(sections_dict.items())
+        if len(sections) <= 1:
+            for section_title, section_content in sections:
+                title, entry = process_section(section_title, section_content)
+                processed_sections[title] = entry
+        else:
+            results: Dict[str, Dict[str, Any]] = {}
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(process_section, title, content)
+                           for title, content in sections]
+                for future in as_completed(futures):
+                    title, entry = future.result()
+                    results[title] = entry
+            # Preserve the document's section order in the output
+            processed_sections = {title: results[title] for title, _ in sections}
+
         return processed_sections
 
 
@@ -4376,18 +6054,41 @@ class DocParsing:
         json_format: Template for the JSON structure
         domain: Domain category for the document
         model_name: Name of the AI model to use
+        use_predicted_outputs: Send the JSON template as a Predicted Outputs
+            draft on parse calls (only for deployments that support it)
     """
     openai_client: OpenAIClient
     json_format: Dict[str, Any]
     domain: str
     model_name: str
 
-    def __init__(self, openai_client: OpenAIClient, json_format: Dict[str, Any], domain: str, model_name: str):
+    def __init__(self, openai_client: OpenAIClient, json_format: Dict[str, Any], domain: str, model_name: str,
+                 use_predicted_outputs: bool = False):
         print(f"Initializing DocParsing")
         self.openai_client = openai_client
         self.json_format = json_format
         self.domain = domain
         self.model_name = model_name
+        # Opt-in: send the JSON template as a Predicted Outputs draft so
+        # deployments that support speculative decoding return the mostly
+        # boilerplate structure faster; leave off where unsupported
+        self.use_predicted_outputs = use_predicted_outputs
+        # Deterministic parse calls are cached on disk so re-ingesting an
+        # unchanged document skips the LLM entirely
+        self._cache_dir = Path('.llm_cache')
+        # The JSON template and parsing instructions are static per instance;
+        # build them once here instead of re-serializing on every AI call
+        self._format_str = json.dumps(self.json_format, indent=4, ensure_ascii=False)
+        self._parse_prompt = (
+            "Parse the provided information about a specific process from the document and fill in the JSON structure below. "
+            "Do not summarize, omit, or modify any details. Simply extract and organize the provided data into the corresponding fields of the JSON. "
+            "There are more than one step and you have to include all of them.The step description has to be the whole text till the next step name"
+            "Ensure every relevant detail is included without altering the content. "
+            "The JSON format should follow this structure and include all fields, even if some of them are not present in the content (leave them empty or null if necessary):\n"
+            f"{self._format_str}\n\n"
+            "To make it clear the content you generate will be ONLY THE CONTENT of a json no \\n nothing.The first character {{ and the last character should be }}" # Escaped braces
+            "Your response should be ONLY a JSON file content ready to be stored as json without other processing, with the exact format as shown above."
+        )
     
     def _get_section_header_lines(self, section: Section) -> List[str]:
         """
@@ -4418,7 +6119,7 @@ class DocParsing:
                         lines.append(" | ".join(row_cells)) # Join cell text for table lines
             return lines
         except Exception as e:
-            print(f"Error extracting header lines for section: {e}")
+            logger.exception("Error extracting header lines for section")
             return []
 
     def _parse_header_lines(self, header_lines: List[str]) -> str:
@@ -4434,10 +6135,10 @@ class DocParsing:
         if not header_lines:
             return "Metadata" # Default if no lines or only empty lines
 
-        # Pattern for process numbers (e.g., 1., 1.1., 1.1.1.)
-        number_pattern = re.compile(r'^\d+(\.\d+)*\.$')
-        # Pattern for specific metadata lines to ignore (Example from doc_parsing.py)
-        meta_patterns = [r'^Εκδ\.', r'Σελ\.'] # Add more patterns if needed
+        # Patterns are compiled once at module scope; one combined alternation
+        # replaces the per-line loop over separate metadata patterns
+        number_pattern = _PROCESS_NUMBER_RE
+        meta_pattern = _META_RE
 
         potential_title = "Metadata" # Start with default
 
@@ -4446,7 +6147,7 @@ class DocParsing:
             if not line_stripped: continue # Skip empty lines
 
             # Skip known metadata lines
-            if any(re.search(pattern, line_stripped) for pattern in meta_patterns):
+            if meta_pattern.search(line_stripped):
                 continue
 
             # Check if line matches "Number.\tTitle" format
@@ -4462,7 +6163,7 @@ class DocParsing:
                 # Look for a non-metadata title in the *next* non-empty line
                 if i + 1 < len(header_lines):
                     next_line_stripped = header_lines[i+1].strip()
-                    if next_line_stripped and not any(re.search(pattern, next_line_stripped) for pattern in meta_patterns):
+                    if next_line_stripped and not meta_pattern.search(next_line_stripped):
                          # Check if the next line looks like a title (heuristic: doesn't start with a number pattern)
                         if not number_pattern.match(next_line_stripped.split()[0] if next_line_stripped else ""):
                             return next_line_stripped # Found title on the next line
@@ -4491,7 +6192,7 @@ class DocParsing:
             header_title = self._parse_header_lines(lines)
             return header_title
         except Exception as e:
-            print(f"Error extracting header info: {e}")
+            logger.exception("Error extracting header info")
             return "Unknown Header" # Return a default on error
 
     def _iterate_block_items_with_section(self, doc: DocumentObject):
@@ -4508,10 +6209,22 @@ class DocParsing:
         current_section_index = 0
         last_element_was_sectPr = False
 
+        # One xpath pass collects the rare paragraphs that end a section, so
+        # the loop below does an O(1) set lookup per paragraph instead of
+        # evaluating an xpath query against every one. The result list must
+        # stay referenced for the generator's lifetime: lxml proxies are
+        # ephemeral and their id()s get recycled once freed, which would
+        # misclassify unrelated paragraphs as section-end markers
+        sect_end_paragraphs = parent_elm.xpath('./w:p[./w:pPr/w:sectPr]')
+        sect_end_ids = {id(p) for p in sect_end_paragraphs}
+
+        # Exact qualified-name comparisons replace the per-child endswith
+        # scans with one hash compare
         for child in parent_elm.iterchildren():
-            if child.tag.endswith("p"):
+            tag = child.tag
+            if tag == _W_P:
                 paragraph = Paragraph(child, doc)
-                is_section_end_paragraph = bool(child.xpath("./w:pPr/w:sectPr"))
+                is_section_end_paragraph = id(child) in sect_end_ids
                 if not is_section_end_paragraph:
                      yield current_section_index, paragraph
                 if is_section_end_paragraph:
@@ -4519,11 +6232,11 @@ class DocParsing:
                     last_element_was_sectPr = True
                 else:
                     last_element_was_sectPr = False
-            elif child.tag.endswith("tbl"):
+            elif tag == _W_TBL:
                 table = Table(child, doc)
                 yield current_section_index, table
                 last_element_was_sectPr = False
-            elif child.tag.endswith('sectPr') and not last_element_was_sectPr:
+            elif tag == _W_SECTPR and not last_element_was_sectPr:
                  current_section_index += 1
 
     def _extract_table_data(self, table: Table):
@@ -4535,12 +6248,7 @@ class DocParsing:
         Returns:
             Joined cells with ' - '.
         """
-        data = []
-        for row in table.rows:
-            row_cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-            if row_cells:
-                data.append(' - '.join(row_cells))
-        return '\n'.join(data) # Join rows with newline
+        return _extract_table_text(table)
 
     def _is_single_process(self, doc_instance: DocumentObject, doc_name: str) -> Tuple[bool, str]:
         """
@@ -4554,30 +6262,27 @@ class DocParsing:
             True if single process, False if multi-process, and the title.
         """
         print("Checking document for single vs. multi-process structure...")
-        section_headers = set()
         first_meaningful_header = None
 
         if not doc_instance.sections:
             print("Document has no sections.")
             return True, doc_name # Treat as single process with doc name as title
 
-        for section_index, section in enumerate(doc_instance.sections):
+        # Only the presence of a second distinct header matters, so the scan
+        # stops at the first one instead of extracting every section header
+        for section in doc_instance.sections:
             header_title = self._extract_header_info(section)
-            if header_title and header_title != "Metadata" and header_title != "Unknown Header":
-                section_headers.add(header_title)
-                if first_meaningful_header is None:
-                    first_meaningful_header = header_title # Store the first valid header found
-
-        num_unique_headers = len(section_headers)
-        print(f"Found {num_unique_headers} unique meaningful header(s): {section_headers if section_headers else 'None'}")
-
-        if num_unique_headers <= 1: # Treat 0 or 1 unique headers as single process
-            title = first_meaningful_header if first_meaningful_header else doc_name
-            print(f"Document treated as single process with title: '{title}'")
-            return True, title
-        else:
-            print("Document identified as multi-process.")
-            return False, None # Title is None for multi-process
+            if not header_title or header_title == "Metadata" or header_title == "Unknown Header":
+                continue
+            if first_meaningful_header is None:
+                first_meaningful_header = header_title # Store the first valid header found
+            elif header_title != first_meaningful_header:
+                print("Document identified as multi-process.")
+                return False, None # Title is None for multi-process
+
+        title = first_meaningful_header if first_meaningful_header else doc_name
+        print(f"Document treated as single process with title: '{title}'")
+        return True, title
 
     def extract_data(self, doc_instance: DocumentObject, doc_name: str) -> Dict[Any, str]:
         """
@@ -4591,43 +6296,43 @@ class DocParsing:
             dict: Keys are formatted headers/process names, values are extracted content strings.
         """
         print("Extracting data based on document structure...")
-        data_dict = {}
+        # Content accumulates straight into per-key string buffers, so there
+        # is no intermediate list of lines and no second join pass
+        data_dict: Dict[str, io.StringIO] = {}
         is_single, process_title = self._is_single_process(doc_instance, doc_name)
 
         if is_single:
-            safe_title = re.sub(r'[\\/*?:"<>|]', '_', process_title) # Basic sanitization
+            safe_title = _SANITIZE_RE.sub('_', process_title) # Basic sanitization
             header_key = f"{safe_title}_single_process"
             print(f"Building content for single process: '{header_key}'")
-            data_dict[header_key] = []
+            buffer = data_dict[header_key] = io.StringIO()
             for _, block in self._iterate_block_items_with_section(doc_instance):
                 if isinstance(block, Paragraph):
                     text = block.text.strip()
-                    if text: data_dict[header_key].append(text)
+                    if text:
+                        buffer.write(text)
+                        buffer.write("\n")
                 elif isinstance(block, Table):
                     table_text = self._extract_table_data(block)
-                    if table_text: data_dict[header_key].append(table_text)
+                    if table_text:
+                        buffer.write(table_text)
+                        buffer.write("\n")
         else:
             print("Building content for multi-process document...")
             last_section_index = -1
             current_header_key = None
-            current_section_content = []
 
             for section_index, block in self._iterate_block_items_with_section(doc_instance):
                 if section_index > last_section_index:
-                    if current_header_key and current_section_content:
-                         data_dict[current_header_key] = "\n".join(current_section_content) # Join previous section
-                         print(f"Finalized content for section {last_section_index}: '{current_header_key}' ({len(current_section_content)} blocks)")
-
                     if section_index < len(doc_instance.sections):
                          header_title = self._extract_header_info(doc_instance.sections[section_index])
                          if not header_title or header_title == "Metadata":
                              header_title = f"Unknown_Section_{section_index}"
-                         safe_header = re.sub(r'[\\/*?:"<>|]', '_', header_title)
+                         safe_header = _SANITIZE_RE.sub('_', header_title)
                          current_header_key = f"{doc_name}_header_{safe_header}"
                          print(f"New Section {section_index}: Header='{header_title}', Key='{current_header_key}'")
                          if current_header_key not in data_dict:
-                              data_dict[current_header_key] = []
-                         current_section_content = [] # Reset buffer
+                              data_dict[current_header_key] = io.StringIO()
                     else:
                          print(f"Warning: Block referenced section_index {section_index} > section count {len(doc_instance.sections)}. Using last header '{current_header_key}'.")
 
@@ -4640,22 +6345,17 @@ class DocParsing:
                     block_text = self._extract_table_data(block)
 
                 if block_text and current_header_key:
-                     # Append text directly to the list in the dictionary
+                     # Append text directly to the section's buffer
                      if current_header_key in data_dict:
-                         data_dict[current_header_key].append(block_text)
+                         buffer = data_dict[current_header_key]
+                         buffer.write(block_text)
+                         buffer.write("\n")
                      else:
                          # This case might happen if the first block has no preceding header info
                          print(f"Warning: No current header key for block, text ignored: '{block_text[:50]}...'")
 
-
-            # Finalize the very last section after the loop
-            if current_header_key and current_section_content:
-                data_dict[current_header_key] = "\n".join(current_section_content)
-                print(f"Finalized content for last section {last_section_index}: '{current_header_key}' ({len(current_section_content)} blocks)")
-
-
-        # Join the collected content lines for each key into final strings
-        final_data = {key: "\n".join(content_list).strip() for key, content_list in data_dict.items()}
+        # Materialize the buffers into final strings
+        final_data = {key: buffer.getvalue().strip() for key, buffer in data_dict.items()}
         print(f"Data extraction complete. Found {len(final_data)} process/section block(s).")
         return final_data
 
@@ -4672,40 +6372,43 @@ class DocParsing:
             str: JSON string containing the parsed content, or None on failure.
         """
         print(f"Requesting AI to parse content for: '{process_identifier}' using model '{self.model_name}'...")
-        format_str = json.dumps(self.json_format, indent=4, ensure_ascii=False)
-
-        # Prompt emphasizing extraction, structure, and JSON-only output
-        prompt = (
-            "Parse the provided information about a specific process from the document and fill in the JSON structure below. "
-            "Do not summarize, omit, or modify any details. Simply extract and organize the provided data into the corresponding fields of the JSON. "
-            "There are more than one step and you have to include all of them.The step description has to be the whole text till the next step name"
-            "Ensure every relevant detail is included without altering the content. "
-            "The JSON format should follow this structure and include all fields, even if some of them are not present in the content (leave them empty or null if necessary):\n"
-            f"{format_str}\n\n"
-            "To make it clear the content you generate will be ONLY THE CONTENT of a json no \\n nothing.The first character {{ and the last character should be }}" # Escaped braces
-            "Your response should be ONLY a JSON file content ready to be stored as json without other processing, with the exact format as shown above."
-         )
+        # Prompt emphasizing extraction, structure, and JSON-only output;
+        # built once in __init__ since it only depends on the JSON template
+        prompt = self._parse_prompt
 
         try:
             if not self.openai_client:
                  print("Error: Azure OpenAI client is not initialized.")
                  return None
 
+            user_content = f"Document Source Name: {doc_name}\nProcess/Section Identifier: {process_identifier}\n\nContent to Parse:\n---\n{content_to_parse}\n---"
             messages=[
                 {"role": "system", "content": prompt},
-                {"role": "user", "content": f"Document Source Name: {doc_name}\nProcess/Section Identifier: {process_identifier}\n\nContent to Parse:\n---\n{content_to_parse}\n---"}
+                {"role": "user", "content": user_content}
             ]
 
-            output_llm = self.openai_client.generate_chat_completion(
-                model=self.model_name,
-                messages=messages,
-                temperature=0,
-                max_tokens=None,
-                response_format={"type": "json_object"} # Request JSON output
-            )
+            cache_key = _llm_cache_key(self.model_name, 0, prompt, user_content)
+            ai_response_content = _llm_cache_get(self._cache_dir, cache_key)
+            if ai_response_content is not None:
+                print(f"Using cached AI response for '{process_identifier}' ({len(ai_response_content)} chars).")
+            else:
+                prediction = None
+                if self.use_predicted_outputs:
+                    prediction = {"type": "content", "content": self._format_str}
+
+                output_llm = self.openai_client.generate_chat_completion(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=0,
+                    max_tokens=None,
+                    response_format={"type": "json_object"}, # Request JSON output
+                    prediction=prediction
+                )
 
-            ai_response_content = output_llm["content"]
-            print(f"AI response received ({len(ai_response_content)} chars).")
+                ai_response_content = output_llm["content"]
+                if ai_response_content:
+                    _llm_cache_put(self._cache_dir, cache_key, ai_response_content)
+                print(f"AI response received ({len(ai_response_content)} chars).")
 
             # Basic validation: Check if it looks like JSON
             if ai_response_content and ai_response_content.strip().startswith("{") and ai_response_content.strip().endswith("}"):
@@ -4713,16 +6416,16 @@ class DocParsing:
             else:
                 print(f"Warning: AI response does not look like valid JSON: {ai_response_content[:100]}...")
                 # Attempt to extract JSON if response_format failed or wasn't respected
-                match = re.search(r'\{.*\}', ai_response_content, re.DOTALL)
-                if match:
+                candidate = _find_balanced_json(ai_response_content)
+                if candidate:
                     print("Extracted potential JSON from response.")
-                    return match.group(0)
+                    return candidate
                 else:
                     print("Error: Could not extract JSON object from AI response.")
                     return None
 
         except Exception as e:
-            print(f"Error during AI call for '{process_identifier}': {e}")
+            logger.exception(f"Error during AI call for '{process_identifier}'")
             return None
 
     def _process_doc(self, ai_json_string: str, doc_name: str, sub_domain: str) -> Dict[str, Any]:
@@ -4735,24 +6438,28 @@ class DocParsing:
             sub_domain: Name of the document sub-domain
         """
         try:
-            # Parse the AI's JSON string into a Python dictionary
-            json_data = json.loads(ai_json_string)
-
-            # Create a new ordered dictionary to control the final structure
-            ordered_data = {}
-            ordered_data["doc_name"] = doc_name
-            ordered_data["process_name"] = json_data.get("process_name", "Unknown Process Name")
-            ordered_data["domain"] = self.domain
-            ordered_data["subdomain"] = sub_domain
-
-            # Add the rest of the fields from the AI response
-            for key, value in json_data.items():
-                if key not in ordered_data:
-                    ordered_data[key] = value
-            return ordered_data
+            # Parse the AI's JSON string into a Python dictionary; orjson
+            # validates and builds the dict in one C pass when available
+            loads = orjson.loads if orjson is not None else json.loads
+            json_data = loads(ai_json_string)
+
+            # Metadata fields are controlled here, so drop any the AI echoed
+            # back before splatting the remainder behind them
+            process_name = json_data.pop("process_name", "Unknown Process Name")
+            for meta_key in ("doc_name", "domain", "subdomain"):
+                json_data.pop(meta_key, None)
+
+            # Build the final structure in a single dict construction
+            return {
+                "doc_name": doc_name,
+                "process_name": process_name,
+                "domain": self.domain,
+                "subdomain": sub_domain,
+                **json_data,
+            }
 
         except json.JSONDecodeError as e:
-            print(f"Error decoding JSON from AI response: {e}")
+            logger.exception("Error decoding JSON from AI response")
 
     def doc_to_json(self, doc_instance: DocumentObject, doc_name: str, sub_domain: str) -> List[Dict[str, Any]]:
         """
@@ -4770,7 +6477,7 @@ class DocParsing:
 
         extracted_data_dict = self.extract_data(doc_instance, doc_name)
         
-        ordered_data = []
+        sections_to_parse = []
         for process_key, content in extracted_data_dict.items():
             print(f"\n   Processing section/process key: '{process_key}'")
             if "Metadata" in process_key or "unknown" in process_key.lower() or not content.strip():
@@ -4782,8 +6489,27 @@ class DocParsing:
             max_len = 100 # Max filename length
             safe_filename_base = safe_filename_base[:max_len] if len(safe_filename_base) > max_len else safe_filename_base
 
-            ai_json_result = self.update_json_with_ai(content, process_key, doc_name)
-
+            sections_to_parse.append((process_key, content))
+
+        # The per-section AI parses are independent, so run them through a
+        # bounded worker pool instead of one blocking call per section; the
+        # same worker bound used by the summarizer keeps request rate within
+        # the service budget
+        ai_results: Dict[str, Optional[str]] = {}
+        if len(sections_to_parse) <= 1:
+            for process_key, content in sections_to_parse:
+                ai_results[process_key] = self.update_json_with_ai(content, process_key, doc_name)
+        elif sections_to_parse:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {process_key: executor.submit(self.update_json_with_ai, content, process_key, doc_name)
+                           for process_key, content in sections_to_parse}
+            for process_key, future in futures.items():
+                ai_results[process_key] = future.result()
+
+        # Assemble results in the document's section order
+        ordered_data = []
+        for process_key, _ in sections_to_parse:
+            ai_json_result = ai_results.get(process_key)
             if ai_json_result:
                 ordered_data.append(self._process_doc(ai_json_result, doc_name, sub_domain))
             else:
@@ -4794,8 +6520,6 @@ class DocParsing:
         print(f"\nDocument-to-list conversion completed for '{doc_name}'")
         return ordered_data
 
-import hashlib
-
 class MultiSectionHandler:
     """
     Sets up the handler to process multiple section chunks and upload them to Azure Search
@@ -5000,7 +6724,7 @@ class MultiSectionHandler:
                     'chunk_gen': chunk_gen_records
                 })
             except Exception as e:
-                print(f"Error processing {self.dict_list}: {e}")
+                logger.exception(f"Error processing {self.dict_list}")
 
         return all_records
     
@@ -5032,80 +6756,115 @@ class MultiSectionHandler:
 
         def get_embeddings_list(openai_client: OpenAIClient, texts: List[str], model: str = 'text-embedding-3-large') -> List[List[float]]:
             """
-            Retrieve embeddings for a list of given texts.
+            Retrieve embeddings for a list of given texts with one batched call.
             Handles text truncation if content exceeds model's token limit.
             """
 
-            embeddings = []
-            for text in texts:
-                if text:
-                    try:
-                        embedding = openai_client.generate_embeddings(text=text, model=model)
-                        embeddings.append(embedding)
-                    except Exception as e:
-                        # Check if error is related to token limit
-                        error_str = str(e)
-                        if "maximum context length" in error_str and "tokens" in error_str:
-                            try:
-                                # Try to extract the requested tokens from error message
-                                import re
-                                match = re.search(r'requested (\d+) tokens', error_str)
-                                requested_tokens = int(match.group(1)) if match else 10000
-                                max_tokens = 8192  # Default max tokens for embedding models
-                                
-                                if "maximum context length is" in error_str:
-                                    max_match = re.search(r'maximum context length is (\d+)', error_str)
-                                    if max_match:
-                                        max_tokens = int(max_match.group(1))
-                                
-                                # Calculate ratio to truncate text
-                                ratio = max_tokens / requested_tokens * 0.9  # 10% safety margin
-                                truncated_length = int(len(text) * ratio)
-                                truncated_text = text[:truncated_length]
-                                print(f"Truncating text from {len(text)} chars to {len(truncated_text)} chars to fit token limit")
-                                
-                                # Try again with truncated text
-                                embedding = openai_client.generate_embeddings(text=truncated_text, model=model)
-                                embeddings.append(embedding)
-                            except Exception as inner_e:
-                                print(f"Error after truncation attempt: {inner_e}")
-                                embeddings.append([])
-                        else:
-                            print(f"Error generating embeddings: {e}")
-                            embeddings.append([])
-                else:
-                    embeddings.append([])
+            def embed_single(text: str) -> List[float]:
+                try:
+                    return openai_client.generate_embeddings(text=text, model=model)
+                except Exception as e:
+                    # Check if error is related to token limit
+                    error_str = str(e)
+                    if "maximum context length" in error_str and "tokens" in error_str:
+                        try:
+                            # Try to extract the requested tokens from error message
+                            import re
+                            match = re.search(r'requested (\d+) tokens', error_str)
+                            requested_tokens = int(match.group(1)) if match else 10000
+                            max_tokens = 8192  # Default max tokens for embedding models
+
+                            if "maximum context length is" in error_str:
+                                max_match = re.search(r'maximum context length is (\d+)', error_str)
+                                if max_match:
+                                    max_tokens = int(max_match.group(1))
+
+                            # Calculate ratio to truncate text
+                            ratio = max_tokens / requested_tokens * 0.9  # 10% safety margin
+                            truncated_length = int(len(text) * ratio)
+                            truncated_text = text[:truncated_length]
+                            print(f"Truncating text from {len(text)} chars to {len(truncated_text)} chars to fit token limit")
+
+                            # Try again with truncated text
+                            return openai_client.generate_embeddings(text=truncated_text, model=model)
+                        except Exception as inner_e:
+                            logger.exception("Error after truncation attempt")
+                            return []
+                    else:
+                        logger.exception("Error generating embeddings")
+                        return []
+
+            embeddings: List[List[float]] = [[] for _ in texts]
+            pending = [i for i, text in enumerate(texts) if text]
+            if not pending:
+                return embeddings
+            try:
+                # One array-input request embeds every text in the batch
+                batch_vectors = openai_client.generate_embeddings(text=[texts[i] for i in pending], model=model)
+                for i, vector in zip(pending, batch_vectors):
+                    embeddings[i] = vector
+            except Exception:
+                # Retry per text so only the offending entries get the
+                # truncation treatment instead of redoing the whole batch
+                logger.exception("Batched embedding call failed; retrying texts individually")
+                for i in pending:
+                    embeddings[i] = embed_single(texts[i])
             return embeddings
-        
+
+        def process_one_record(record: Dict) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+            # Collect every text in the record so one batched call covers
+            # the section description and all chunk contents
+            texts: List[str] = []
+            slots: List[Tuple[Dict[str, Any], str]] = []
+            if 'section_llm_description' in record['core_gen']:
+                texts.append(record['core_gen']['section_llm_description'])
+                slots.append((record['core_gen'], 'embedding_llm_description'))
+            for chunk in record['chunk_gen']:
+                if 'chunk_id' in chunk:
+                    chunk['chunk_id'] = str(chunk['chunk_id'])
+                if 'chunk_content' in chunk:
+                    texts.append(chunk['chunk_content'])
+                    slots.append((chunk, 'embedding_chunk_content'))
+
+            if texts:
+                embeddings = get_embeddings_list(openai_client, texts)
+                # Slice the returned vectors back into their fields
+                for (target, field), vector in zip(slots, embeddings):
+                    target[field] = vector
+
+            record['core_gen']['section_id'] = str(record['core_gen']['section_id'])
+            for i in record['chunk_gen']:
+                i['chunk_id'] = str(i['chunk_id'])
+
+            return record['core_gen'], record['chunk_gen']
+
+        # Embedding is network-bound, so records run through a bounded worker
+        # pool; their documents are then accumulated and flushed a few
+        # hundred at a time so Azure Search sees large batches instead of
+        # one HTTP envelope per record
+        batch_size = 500
         try:
-            for record in all_records:
-                # For the core_gen record, generate an embedding for 'section_llm_description' if it exists.
-                if 'section_llm_description' in record['core_gen']:
-                    description_text = record['core_gen']['section_llm_description']
-                    embeddings = get_embeddings_list(openai_client, [description_text])
-                    if embeddings and len(embeddings) > 0:
-                        # Assign the embedding vector (list of numbers) directly
-                        record['core_gen']['embedding_llm_description'] = embeddings[0]
-                
-                # For each chunk record in the chunk_gen part, generate embeddings for chunk_content.
-                for chunk in record['chunk_gen']:
-                    if 'chunk_id' in chunk:
-                        chunk['chunk_id'] = str(chunk['chunk_id'])
-                    if 'chunk_content' in chunk:
-                        chunk_content_embeddings = get_embeddings_list(openai_client, [chunk['chunk_content']])
-                        if chunk_content_embeddings and len(chunk_content_embeddings) > 0:
-                            chunk['embedding_chunk_content'] = chunk_content_embeddings[0]
-                
-                record['core_gen']['section_id'] = str(record['core_gen']['section_id'])
-                for i in record['chunk_gen']:
-                    i['chunk_id'] = str(i['chunk_id'])
-                
-                # Now upload the records to the respective Azure Search indexes.
-                response_core = index_client_core_gen.upload_rows(documents=[record['core_gen']])
-                response_detail = index_client_chunk_gen.upload_rows(documents=record['chunk_gen'])
-                print(f"Successfully uploaded records for {record['core_gen'].get('section_name', 'Unknown')}")
+            core_batch: List[Dict[str, Any]] = []
+            detail_batch: List[Dict[str, Any]] = []
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for core_doc, detail_docs in executor.map(process_one_record, all_records):
+                    core_batch.append(core_doc)
+                    detail_batch.extend(detail_docs)
+                    print(f"Prepared records for {core_doc.get('section_name', 'Unknown')}")
+                    if len(core_batch) >= batch_size:
+                        index_client_core_gen.upload_rows(documents=core_batch)
+                        core_batch = []
+                    if len(detail_batch) >= batch_size:
+                        index_client_chunk_gen.upload_rows(documents=detail_batch)
+                        detail_batch = []
+            # Flush the remainders
+            if core_batch:
+                index_client_core_gen.upload_rows(documents=core_batch)
+            if detail_batch:
+                index_client_chunk_gen.upload_rows(documents=detail_batch)
+            print(f"Successfully uploaded records for {len(all_records)} section(s)")
         except Exception as e:
-            print(f"Error uploading records: {e}")
+            logger.exception("Error uploading records")
 
 class MultiProcessHandler:
     """
@@ -5339,7 +7098,7 @@ class MultiProcessHandler:
                     'detailed': detailed_records
                 })
             except Exception as e:
-                print(f"Error processing {self.dict_list}: {e}")
+                logger.exception(f"Error processing {self.dict_list}")
 
         return all_records
     
@@ -5371,86 +7130,119 @@ class MultiProcessHandler:
 
         def get_embeddings_list(openai_client: OpenAIClient, texts: List[str], model: str = 'text-embedding-3-large') -> List[List[float]]:
             """
-            Retrieve embeddings for a list of given texts.
+            Retrieve embeddings for a list of given texts with one batched call.
             Handles text truncation if content exceeds model's token limit.
             """
 
-            embeddings = []
-            for text in texts:
-                if text:
-                    try:
-                        embedding = openai_client.generate_embeddings(text=text, model=model)
-                        embeddings.append(embedding)
-                    except Exception as e:
-                        # Check if error is related to token limit
-                        error_str = str(e)
-                        if "maximum context length" in error_str and "tokens" in error_str:
-                            try:
-                                # Try to extract the requested tokens from error message
-                                import re
-                                match = re.search(r'requested (\d+) tokens', error_str)
-                                requested_tokens = int(match.group(1)) if match else 10000
-                                max_tokens = 8192  # Default max tokens for embedding models
-                                
-                                if "maximum context length is" in error_str:
-                                    max_match = re.search(r'maximum context length is (\d+)', error_str)
-                                    if max_match:
-                                        max_tokens = int(max_match.group(1))
-                                
-                                # Calculate ratio to truncate text
-                                ratio = max_tokens / requested_tokens * 0.9  # 10% safety margin
-                                truncated_length = int(len(text) * ratio)
-                                truncated_text = text[:truncated_length]
-                                print(f"Truncating text from {len(text)} chars to {len(truncated_text)} chars to fit token limit")
-                                
-                                # Try again with truncated text
-                                embedding = openai_client.generate_embeddings(text=truncated_text, model=model)
-                                embeddings.append(embedding)
-                            except Exception as inner_e:
-                                print(f"Error after truncation attempt: {inner_e}")
-                                embeddings.append([])
-                        else:
-                            print(f"Error generating embeddings: {e}")
-                            embeddings.append([])
-                else:
-                    embeddings.append([])
+            def embed_single(text: str) -> List[float]:
+                try:
+                    return openai_client.generate_embeddings(text=text, model=model)
+                except Exception as e:
+                    # Check if error is related to token limit
+                    error_str = str(e)
+                    if "maximum context length" in error_str and "tokens" in error_str:
+                        try:
+                            # Try to extract the requested tokens from error message
+                            import re
+                            match = re.search(r'requested (\d+) tokens', error_str)
+                            requested_tokens = int(match.group(1)) if match else 10000
+                            max_tokens = 8192  # Default max tokens for embedding models
+
+                            if "maximum context length is" in error_str:
+                                max_match = re.search(r'maximum context length is (\d+)', error_str)
+                                if max_match:
+                                    max_tokens = int(max_match.group(1))
+
+                            # Calculate ratio to truncate text
+                            ratio = max_tokens / requested_tokens * 0.9  # 10% safety margin
+                            truncated_length = int(len(text) * ratio)
+                            truncated_text = text[:truncated_length]
+                            print(f"Truncating text from {len(text)} chars to {len(truncated_text)} chars to fit token limit")
+
+                            # Try again with truncated text
+                            return openai_client.generate_embeddings(text=truncated_text, model=model)
+                        except Exception as inner_e:
+                            logger.exception("Error after truncation attempt")
+                            return []
+                    else:
+                        logger.exception("Error generating embeddings")
+                        return []
+
+            embeddings: List[List[float]] = [[] for _ in texts]
+            pending = [i for i, text in enumerate(texts) if text]
+            if not pending:
+                return embeddings
+            try:
+                # One array-input request embeds every text in the batch
+                batch_vectors = openai_client.generate_embeddings(text=[texts[i] for i in pending], model=model)
+                for i, vector in zip(pending, batch_vectors):
+                    embeddings[i] = vector
+            except Exception:
+                # Retry per text so only the offending entries get the
+                # truncation treatment instead of redoing the whole batch
+                logger.exception("Batched embedding call failed; retrying texts individually")
+                for i in pending:
+                    embeddings[i] = embed_single(texts[i])
             return embeddings
-        
-        try:
-            for record in all_records:
-                # For the core record, generate an embedding for 'non_llm_summary' if it exists.
-                if 'non_llm_summary' in record['core']:
-                    summary_text = record['core']['non_llm_summary']
-                    embeddings = get_embeddings_list(openai_client, [summary_text])
-                    if embeddings and len(embeddings) > 0:
-                        # Assign the embedding vector (list of numbers) directly
-                        record['core']['embedding_summary'] = embeddings[0]
-                
-                # For each step record in the detailed part, generate embeddings for step_name and step_content.
-                for step in record['detailed']:
-                    # Ensure the step id is a string
-                    if 'id' in step:
-                        step['id'] = str(step['id'])
-                    if 'step_name' in step:
-                        name_embeddings = get_embeddings_list(openai_client, [step['step_name']])
-                        if name_embeddings and len(name_embeddings) > 0:
-                            step['embedding_title'] = name_embeddings[0]
-                    if 'step_content' in step:
-                        content_embeddings = get_embeddings_list(openai_client, [step['step_content']])
-                        if content_embeddings and len(content_embeddings) > 0:
-                            step['embedding_content'] = content_embeddings[0]
-                
-                record['core']['process_id'] = str(record['core']['process_id'])
-                for i in record['detailed']:
-                    i['id'] = str(i['id'])
 
-                
-                # Now upload the records to the respective Azure Search indexes.
-                response_core = index_client_core.upload_rows(documents=[record['core']])
-                response_detail = index_client_detail.upload_rows(documents=record['detailed'])
-                print(f"Successfully uploaded records for {record['core'].get('process_name', 'Unknown')}")
+        def process_one_record(record: Dict) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+            # Collect every text in the record so one batched call covers
+            # the core summary and all step names and contents
+            texts: List[str] = []
+            slots: List[Tuple[Dict[str, Any], str]] = []
+            if 'non_llm_summary' in record['core']:
+                texts.append(record['core']['non_llm_summary'])
+                slots.append((record['core'], 'embedding_summary'))
+            for step in record['detailed']:
+                # Ensure the step id is a string
+                if 'id' in step:
+                    step['id'] = str(step['id'])
+                if 'step_name' in step:
+                    texts.append(step['step_name'])
+                    slots.append((step, 'embedding_title'))
+                if 'step_content' in step:
+                    texts.append(step['step_content'])
+                    slots.append((step, 'embedding_content'))
+
+            if texts:
+                embeddings = get_embeddings_list(openai_client, texts)
+                # Slice the returned vectors back into their fields
+                for (target, field), vector in zip(slots, embeddings):
+                    target[field] = vector
+
+            record['core']['process_id'] = str(record['core']['process_id'])
+            for i in record['detailed']:
+                i['id'] = str(i['id'])
+
+            return record['core'], record['detailed']
+
+        # Embedding is network-bound, so records run through a bounded worker
+        # pool; their documents are then accumulated and flushed a few
+        # hundred at a time so Azure Search sees large batches instead of
+        # one HTTP envelope per record
+        batch_size = 500
+        try:
+            core_batch: List[Dict[str, Any]] = []
+            detail_batch: List[Dict[str, Any]] = []
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for core_doc, detail_docs in executor.map(process_one_record, all_records):
+                    core_batch.append(core_doc)
+                    detail_batch.extend(detail_docs)
+                    print(f"Prepared records for {core_doc.get('process_name', 'Unknown')}")
+                    if len(core_batch) >= batch_size:
+                        index_client_core.upload_rows(documents=core_batch)
+                        core_batch = []
+                    if len(detail_batch) >= batch_size:
+                        index_client_detail.upload_rows(documents=detail_batch)
+                        detail_batch = []
+            # Flush the remainders
+            if core_batch:
+                index_client_core.upload_rows(documents=core_batch)
+            if detail_batch:
+                index_client_detail.upload_rows(documents=detail_batch)
+            print(f"Successfully uploaded records for {len(all_records)} process(es)")
         except Exception as e:
-            print(f"Error uploading records: {e}")
+            logger.exception("Error uploading records")
 
 
 from typing import Union